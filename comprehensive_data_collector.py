@@ -2,23 +2,260 @@
 # Fixed version with proper data validation
 
 import time
+import logging
 import pandas as pd
+import numpy as np
 import os
 import requests
 import json
+import hashlib
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import random
+import re
+import threading
+from concurrent.futures import Future
 from datetime import datetime
+from types import MappingProxyType
 from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    orjson = None
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # Streaming parse is optional
+    ijson = None
+
+# Responses at least this large (or of unknown size) are stream-parsed when ijson is available
+STREAM_PARSE_MIN_BYTES = 1_000_000
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the plain NumPy kernel is used instead
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# Load environment variables once per process, even when several modules import this
+_dotenv_loaded = False
+
+def _load_env_once():
+    """Load .env on first call only; the flag stays in this process"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+_load_env_once()
+
+_API_KEY = os.getenv('RAPIDAPI_KEY')
+
+logger = logging.getLogger(__name__)
+
+# Coordinate lookup paths, flat keys first (the usual RapidAPI schema)
+LAT_PATHS = (('latitude',), ('lat',), ('latLong', 'latitude'))
+LON_PATHS = (('longitude',), ('lon',), ('lng',), ('latLong', 'longitude'))
+
+def _preview_json(data, limit=500):
+    """Serialize a payload once and truncate it for debug output"""
+    if orjson is not None:
+        raw = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(data, indent=2).encode()
+    suffix = b'...' if len(raw) > limit else b''
+    return (raw[:limit] + suffix).decode(errors='ignore')
+
+_GARAGE_RE = re.compile(r'garage', re.IGNORECASE)
+
+def _dig(prop, paths):
+    """Return the first numeric value (numbers or numeric strings) found along the given key paths"""
+    for path in paths:
+        value = prop
+        for key in path:
+            value = value.get(key) if isinstance(value, dict) else None
+            if value is None:
+                break
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            return float(value)
+        if isinstance(value, str):
+            try:
+                return float(value.replace(',', '').strip())
+            except ValueError:
+                continue
+    return None
+
+# Neighborhood centers, allocated once for coordinate and neighborhood estimates
+_NEIGHBORHOOD_COORDS = MappingProxyType({
+    'Plymouth': (45.01, -93.45),
+    'Woodbury': (44.92, -92.96),
+    'Maple Grove': (45.07, -93.46),
+    'Blaine': (45.16, -93.23),
+    'Eagan': (44.80, -93.17),
+    'Roseville': (45.01, -93.16),
+    'Minnetonka': (44.92, -93.47),
+    'Minneapolis': (44.98, -93.27)
+})
+_NEIGHBORHOODS_TUPLE = tuple(_NEIGHBORHOOD_COORDS.items())
+
+# lowercase name -> (display name, (lat, lon))
+_NB_BY_KEY = MappingProxyType({name.lower(): (name, coords) for name, coords in _NEIGHBORHOODS_TUPLE})
+
+# One alternation scanned in a single pass; Minneapolis is listed last so it only wins alone
+_NB_RE = re.compile('(' + '|'.join(map(re.escape, _NB_BY_KEY)) + ')', re.IGNORECASE)
+_NB_RANK = MappingProxyType({key: rank for rank, key in enumerate(_NB_BY_KEY)})
+
+def _match_neighborhood(address):
+    """(name, coords) of the highest-priority known neighborhood named in the address"""
+    if not address:
+        return None
+    keys = {match.group(1).lower() for match in _NB_RE.finditer(address)}
+    return _NB_BY_KEY[min(keys, key=_NB_RANK.__getitem__)] if keys else None
+
+# Column dtypes for collected houses, declared up front instead of inferred
+HOUSE_SCHEMA = {
+    'data_source': 'category',
+    'zpid': 'object',
+    'address': 'string',
+    'price': 'int64',
+    'bedrooms': 'int16',
+    'bathrooms': 'float32',
+    'sqft': 'int32',
+    'lot_size': 'float32',
+    'year_built': 'int16',
+    'latitude': 'float32',
+    'longitude': 'float32',
+    'property_type': 'category',
+    'listing_url': 'string',
+    'zestimate': 'float64',
+    'days_on_market': 'float32',
+    'price_change': 'float64',
+    'listing_status': 'category',
+    'photos': 'object',
+    'last_updated': 'string',
+    'price_per_sqft': 'float32',
+    'has_garage': 'bool',
+    'neighborhood': 'category'
+}
+
+# Keys that may hold the property list, in resolution order
+PROPS_KEYS = ('props', 'results', 'properties', 'listings', 'homes')
+
+def _resolve_props(data):
+    """The first non-empty property list in a parsed search response"""
+    for key in PROPS_KEYS:
+        if data.get(key):
+            return data[key]
+    return []
+
+def _iter_prop_items(raw):
+    """Yield (key, item) for each object in the top-level property lists of a JSON stream"""
+    prefixes = {f"{key}.item": key for key in PROPS_KEYS}
+    builder = None
+    
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if event == 'end_map' and prefix == current:
+                yield prefixes[current], builder.value
+                builder = None
+        elif event == 'start_map' and prefix in prefixes:
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            current = prefix
+
+class RequestCoalescer:
+    """Share one in-flight call, and its result for a short TTL, among identical requests"""
+    
+    def __init__(self, ttl_seconds=60):
+        self.ttl = ttl_seconds
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.results = {}
+    
+    def call(self, key, fetch):
+        """Return fetch() for key, deduplicating concurrent and recent calls"""
+        with self.lock:
+            cached = self.results.get(key)
+            if cached and time.monotonic() - cached[0] < self.ttl:
+                return cached[1]
+            
+            future = self.in_flight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self.in_flight[key] = future
+        
+        if not is_owner:
+            return future.result()
+        
+        try:
+            result = fetch()
+            if result:  # Don't pin failures/empty responses for the TTL
+                with self.lock:
+                    self.results[key] = (time.monotonic(), result)
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self.in_flight.pop(key, None)
+
+class ResponseCache:
+    """File-backed cache of API results keyed by request URL and params"""
+    
+    def __init__(self, cache_dir='.zillow_cache', ttl_seconds=86400):
+        self.cache_dir = cache_dir
+        self.ttl = ttl_seconds
+    
+    def _path(self, url, params):
+        raw = json.dumps({'url': url, 'params': params}, sort_keys=True).encode()
+        key = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def get(self, url, params):
+        """Return cached data if present and fresh, else None"""
+        path = self._path(url, params)
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            with open(path, 'rb') as f:
+                cached = _json_loads(f.read())
+            if time.time() - cached['timestamp'] < self.ttl:
+                return cached['data']
+        except Exception as e:
+            print(f"⚠️ Cache read error: {e}")
+        return None
+    
+    def set(self, url, params, data):
+        """Store data for this request"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(url, params), 'w') as f:
+                json.dump({'timestamp': time.time(), 'data': data}, f)
+        except Exception as e:
+            print(f"⚠️ Cache save error: {e}")
 
 class ZillowDataCollector:
     """Fixed Zillow data collector with better error handling"""
     
+    __slots__ = ('api_key', 'base_url', 'coalescer', 'cache', 'headers', 'session')
+    
+    _NEIGHBORHOOD_COORDS = _NEIGHBORHOOD_COORDS
+    
     def __init__(self):
-        self.api_key = os.getenv('RAPIDAPI_KEY')
+        self.api_key = _API_KEY
         self.base_url = "https://zillow-com1.p.rapidapi.com"
+        self.coalescer = RequestCoalescer(ttl_seconds=60)
+        self.cache = ResponseCache()
         
         if not self.api_key:
             print("❌ RAPIDAPI_KEY not found in .env file!")
@@ -29,9 +266,30 @@ class ZillowDataCollector:
             "X-RapidAPI-Host": "zillow-com1.p.rapidapi.com"
         }
         
+        # Pooled keep-alive session; retries back off on 429/5xx
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        ))
+        
         print(f"✅ API key loaded: {self.api_key[:8]}...")
     
-    def search_minneapolis_houses(self, max_price=400000, min_beds=3):
+    def close(self):
+        """Close the pooled HTTP session"""
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def search_minneapolis_houses(self, max_price=400000, min_beds=3, force_refresh=False):
         """Search for houses with better error handling"""
         
         print(f"🏠 Searching houses (${max_price:,} max, {min_beds}+ beds)...")
@@ -46,15 +304,40 @@ class ZillowDataCollector:
             "sortSelection": "priorityscore"
         }
         
+        if force_refresh:
+            return self._fetch_search(url, params, force_refresh=True)
+        
+        # Identical searches in flight or within the TTL share one network call
+        key = (url, frozenset(params.items()))
+        return list(self.coalescer.call(key, lambda: self._fetch_search(url, params)))
+    
+    def _fetch_search(self, url, params, force_refresh=False):
+        """Run one search request (or serve it from the disk cache) and parse the result"""
+        
+        if not force_refresh:
+            cached = self.cache.get(url, params)
+            if cached is not None:
+                print(f"📋 Using cached search results ({len(cached)} houses)")
+                return cached
+        
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=20)
+            with self.session.get(url, params=params, timeout=20, stream=True) as response:
+                
+                if response.status_code != 200:
+                    print(f"❌ Search failed: {response.status_code}")
+                    return []
+                
+                size = int(response.headers.get('Content-Length') or STREAM_PARSE_MIN_BYTES)
+                if ijson is not None and size >= STREAM_PARSE_MIN_BYTES:
+                    # Parse each property as it arrives instead of materializing the payload
+                    response.raw.decode_content = True
+                    houses = self.parse_zillow_stream(response.raw)
+                else:
+                    houses = self.parse_zillow_response(_json_loads(response.content))
             
-            if response.status_code == 200:
-                data = response.json()
-                return self.parse_zillow_response(data)
-            else:
-                print(f"❌ Search failed: {response.status_code}")
-                return []
+            if houses:
+                self.cache.set(url, params, houses)
+            return houses
                 
         except Exception as e:
             print(f"❌ Search error: {e}")
@@ -63,46 +346,77 @@ class ZillowDataCollector:
     def parse_zillow_response(self, data):
         """Parse response with better validation"""
         
-        houses = []
-        
         try:
-            props = data.get('props', [])
-            
-            if not props:
-                for key in ['results', 'properties', 'listings', 'homes']:
-                    if key in data and data[key]:
-                        props = data[key]
-                        break
+            props = _resolve_props(data)
             
             if not props:
                 print("⚠️ No properties found in response")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response preview: %s", _preview_json(data))
                 return []
             
             print(f"🏠 Processing {len(props)} properties...")
+            return self.parse_properties(props)
             
-            for i, prop in enumerate(props):
-                try:
-                    house = self.extract_property_details(prop)
-                    if house:
-                        houses.append(house)
-                except Exception as e:
-                    print(f"⚠️ Error parsing property {i+1}: {e}")
-                    continue
+        except Exception as e:
+            print(f"❌ Response parsing error: {e}")
+            return []
+    
+    def parse_zillow_stream(self, raw):
+        """Streaming counterpart of parse_zillow_response for large payloads"""
+        
+        try:
+            items = _iter_prop_items(raw)
             
-            print(f"✅ Successfully parsed {len(houses)} houses")
-            return houses
+            # Properties under 'props' are parsed as they stream in; other lists wait their turn
+            fallback = {}
+            for key, item in items:
+                if key == 'props':
+                    first = item
+                    break
+                fallback.setdefault(key, []).append(item)
+            else:
+                # No non-empty 'props' list: resolve the fallback keys like a small response
+                return self.parse_zillow_response(fallback)
+            
+            def props_items():
+                yield first
+                for key, item in items:
+                    if key == 'props':
+                        yield item
+            
+            print("🏠 Processing streamed properties...")
+            return self.parse_properties(props_items())
             
         except Exception as e:
             print(f"❌ Response parsing error: {e}")
             return []
     
+    def parse_properties(self, props):
+        """Extract houses from an iterable of property dicts (list or stream)"""
+        
+        houses = []
+        count = 0
+        
+        for count, prop in enumerate(props, 1):
+            try:
+                house = self.extract_property_details(prop)
+                if house:
+                    houses.append(house)
+            except Exception as e:
+                logger.debug("Error parsing property %d: %s", count, e)
+                continue
+        
+        print(f"✅ Successfully parsed {len(houses)} of {count} houses")
+        return houses
+    
     def extract_property_details(self, prop):
         """Extract house details with proper validation"""
         
         try:
             # Get coordinates with fallback
-            latitude = self.safe_get_number(prop, ['latitude', 'lat'])
-            longitude = self.safe_get_number(prop, ['longitude', 'lon', 'lng'])
+            latitude = _dig(prop, LAT_PATHS)
+            longitude = _dig(prop, LON_PATHS)
             
             # If no coordinates, estimate from address
             if not latitude or not longitude:
@@ -137,7 +451,9 @@ class ZillowDataCollector:
             else:
                 house['price_per_sqft'] = 0
             
-            house['has_garage'] = 'garage' in str(prop).lower()
+            # Only look at fields that can describe a garage, not the whole payload
+            garage_text = f"{prop.get('description') or ''} {prop.get('homeFacts') or ''} {prop.get('resoFacts') or ''}"
+            house['has_garage'] = _GARAGE_RE.search(garage_text) is not None
             house['neighborhood'] = self.estimate_neighborhood_from_address(house['address'])
             
             # Validate essential fields before returning
@@ -147,7 +463,7 @@ class ZillowDataCollector:
                 return None
                 
         except Exception as e:
-            print(f"⚠️ Property extraction error: {e}")
+            logger.debug("Property extraction error: %s", e)
             return None
     
     def safe_get_number(self, data, field_names, default=None):
@@ -203,22 +519,10 @@ class ZillowDataCollector:
     def estimate_coordinates(self, address):
         """Estimate coordinates from address"""
         
-        neighborhoods = {
-            'plymouth': (45.01, -93.45),
-            'woodbury': (44.92, -92.96),
-            'maple grove': (45.07, -93.46),
-            'blaine': (45.16, -93.23),
-            'eagan': (44.80, -93.17),
-            'roseville': (45.01, -93.16),
-            'minnetonka': (44.92, -93.47),
-            'minneapolis': (44.98, -93.27)
-        }
-        
-        if address:
-            address_lower = address.lower()
-            for name, coords in neighborhoods.items():
-                if name in address_lower:
-                    return coords[0] + random.uniform(-0.01, 0.01), coords[1] + random.uniform(-0.01, 0.01)
+        match = _match_neighborhood(address)
+        if match:
+            lat, lon = match[1]
+            return lat + random.uniform(-0.01, 0.01), lon + random.uniform(-0.01, 0.01)
         
         # Default to Minneapolis
         return 44.9778 + random.uniform(-0.1, 0.1), -93.2650 + random.uniform(-0.1, 0.1)
@@ -226,21 +530,67 @@ class ZillowDataCollector:
     def estimate_neighborhood_from_address(self, address):
         """Estimate neighborhood from address"""
         
-        if not address:
-            return 'Minneapolis'
-        
-        neighborhoods = ['Plymouth', 'Woodbury', 'Maple Grove', 'Blaine', 'Eagan', 'Roseville', 'Minnetonka']
-        address_lower = address.lower()
-        
-        for neighborhood in neighborhoods:
-            if neighborhood.lower() in address_lower:
-                return neighborhood
-        
-        return 'Minneapolis'
+        match = _match_neighborhood(address)
+        return match[0] if match else 'Minneapolis'
+
+@njit(cache=True)
+def _clean_numeric(values, defaults, lower, upper):
+    """Replace missing (NaN) or out-of-range values with their defaults"""
+    bad = np.isnan(values) | (values < lower) | (values > upper)
+    return np.where(bad, defaults, values)
+
+def _to_float(value):
+    """Coerce a raw field value to float, NaN when it isn't numeric"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+def _numeric_bounds(defaults, fields, ranges):
+    """Default, lower and upper bound arrays aligned with fields"""
+    lower = [ranges.get(field, (-np.inf, np.inf))[0] for field in fields]
+    upper = [ranges.get(field, (-np.inf, np.inf))[1] for field in fields]
+    return (np.array([defaults[field] for field in fields], dtype=np.float64),
+            np.array(lower, dtype=np.float64),
+            np.array(upper, dtype=np.float64))
 
 class AdvancedHouseScorer:
     """Fixed house scorer with proper validation"""
     
+    # Default values for missing or invalid data
+    SCORING_DEFAULTS = {
+        'price': 350000,
+        'bedrooms': 3,
+        'bathrooms': 2,
+        'sqft': 1500,
+        'year_built': 2010,
+        'latitude': 44.9778,
+        'longitude': -93.2650,
+        'has_garage': True,
+        'lot_size': 7000,
+        'days_on_market': 30,
+        'price_change': 0,
+        'neighborhood': 'Minneapolis',
+        'school_rating': 8.0,
+        'walk_score': 60,
+        'property_type': 'Single Family',
+        'address': 'Unknown Address'
+    }
+    
+    NUMERIC_FIELDS = ['price', 'bedrooms', 'bathrooms', 'sqft', 'year_built', 
+                      'latitude', 'longitude', 'lot_size', 'days_on_market', 
+                      'price_change', 'school_rating', 'walk_score']
+    
+    VALID_RANGES = {
+        'price': (50000, 2000000),
+        'sqft': (500, 10000),
+        'year_built': (1900, 2025)
+    }
+    
+    _NUMERIC_DEFAULTS, _NUMERIC_LOWER, _NUMERIC_UPPER = _numeric_bounds(
+        SCORING_DEFAULTS, NUMERIC_FIELDS, VALID_RANGES
+    )
+    
     def __init__(self):
         self.preferences = {
             'max_budget': 400000,
@@ -262,12 +612,13 @@ class AdvancedHouseScorer:
         
         self.downtown_minneapolis = (44.9778, -93.2650)
     
-    def score_house(self, house):
+    def score_house(self, house, cleaned_house=None):
         """Score house with proper validation"""
         
         try:
-            # Validate and clean house data first
-            cleaned_house = self.ensure_scoring_compatibility(house)
+            # Validate and clean house data first (unless pre-cleaned in bulk)
+            if cleaned_house is None:
+                cleaned_house = self.ensure_scoring_compatibility(house)
             
             # Calculate individual scores
             price_score = self.calculate_price_score(cleaned_house['price'])
@@ -309,7 +660,7 @@ class AdvancedHouseScorer:
             }
             
         except Exception as e:
-            print(f"Scoring error: {e}")
+            logger.debug("Scoring error: %s", e)
             return {
                 'overall_score': 0,
                 'price_score': 0,
@@ -325,62 +676,64 @@ class AdvancedHouseScorer:
     def ensure_scoring_compatibility(self, house):
         """Ensure house has all required fields with valid values"""
         
-        # Default values for missing or invalid data
-        defaults = {
-            'price': 350000,
-            'bedrooms': 3,
-            'bathrooms': 2,
-            'sqft': 1500,
-            'year_built': 2010,
-            'latitude': 44.9778,
-            'longitude': -93.2650,
-            'has_garage': True,
-            'lot_size': 7000,
-            'days_on_market': 30,
-            'price_change': 0,
-            'neighborhood': 'Minneapolis',
-            'school_rating': 8.0,
-            'walk_score': 60,
-            'property_type': 'Single Family',
-            'address': 'Unknown Address'
-        }
+        defaults = self.SCORING_DEFAULTS
         
-        cleaned_house = {}
+        # Numeric fields: coerce, then default/clamp in one array operation
+        values = np.array([_to_float(house.get(field)) for field in self.NUMERIC_FIELDS])
+        values = _clean_numeric(values, self._NUMERIC_DEFAULTS, self._NUMERIC_LOWER, self._NUMERIC_UPPER)
+        cleaned_house = dict(zip(self.NUMERIC_FIELDS, values.tolist()))
+        cleaned_house['bedrooms'] = int(cleaned_house['bedrooms'])
+        cleaned_house['bathrooms'] = int(cleaned_house['bathrooms'])
         
-        for field, default_value in defaults.items():
+        has_garage = house.get('has_garage')
+        cleaned_house['has_garage'] = has_garage if isinstance(has_garage, bool) else defaults['has_garage']
+        
+        for field in ['neighborhood', 'property_type', 'address']:
             value = house.get(field)
+            if value is None or str(value) == '' or str(value).lower() == 'none':
+                cleaned_house[field] = defaults[field]
+            else:
+                cleaned_house[field] = str(value)
+        
+        return cleaned_house
+    
+    @classmethod
+    def clean_frame(cls, df):
+        """Vectorized cleanup of all houses at once; returns only the scoring fields"""
+        
+        defaults = cls.SCORING_DEFAULTS
+        cleaned = pd.DataFrame(index=df.index)
+        
+        for field, default_value in defaults.items():
+            if field not in df.columns:
+                cleaned[field] = default_value
+                continue
+            
+            col = df[field]
             
             # Handle None or invalid values
-            if value is None or value == '' or str(value).lower() == 'none':
-                cleaned_house[field] = default_value
+            if field in cls.NUMERIC_FIELDS:
+                col = pd.to_numeric(col, errors='coerce').fillna(default_value)
+                if field in ['bedrooms', 'bathrooms']:
+                    col = col.astype(int)
+            elif field == 'has_garage':
+                if col.dtype != bool:
+                    col = col.where(col.isin([True, False]), default_value)
+                col = col.astype(bool)
             else:
-                # Try to convert numeric fields
-                if field in ['price', 'bedrooms', 'bathrooms', 'sqft', 'year_built', 
-                           'latitude', 'longitude', 'lot_size', 'days_on_market', 
-                           'price_change', 'school_rating', 'walk_score']:
-                    try:
-                        if field in ['bedrooms', 'bathrooms']:
-                            cleaned_house[field] = int(float(value))
-                        else:
-                            cleaned_house[field] = float(value)
-                    except (ValueError, TypeError):
-                        cleaned_house[field] = default_value
-                elif field == 'has_garage':
-                    cleaned_house[field] = bool(value) if isinstance(value, bool) else default_value
-                else:
-                    cleaned_house[field] = str(value) if value else default_value
+                text = col.astype(str)
+                valid = col.notna() & (text != '') & (text.str.lower() != 'none')
+                col = text.where(valid, default_value)
+            
+            cleaned[field] = col
         
         # Validate ranges
-        if cleaned_house['price'] < 50000 or cleaned_house['price'] > 2000000:
-            cleaned_house['price'] = defaults['price']
-        
-        if cleaned_house['sqft'] < 500 or cleaned_house['sqft'] > 10000:
-            cleaned_house['sqft'] = defaults['sqft']
-        
-        if cleaned_house['year_built'] < 1900 or cleaned_house['year_built'] > 2025:
-            cleaned_house['year_built'] = defaults['year_built']
+        for field, (min_val, max_val) in cls.VALID_RANGES.items():
+            cleaned[field] = cleaned[field].where(
+                cleaned[field].between(min_val, max_val), defaults[field]
+            )
         
-        return cleaned_house
+        return cleaned
     
     def calculate_price_score(self, price):
         """Calculate price score"""
@@ -458,16 +811,42 @@ class AdvancedHouseScorer:
         else:
             return "⚠️ BELOW THRESHOLD"
 
+def save_houses_frame(df, filename):
+    """Save houses as CSV (pyarrow writer when available) plus a Parquet sidecar"""
+    
+    # Store list-valued photos as JSON rather than their Python repr
+    if 'photos' in df.columns:
+        df = df.assign(photos=df['photos'].map(lambda p: p if isinstance(p, str) else json.dumps(p)))
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        df.to_csv(filename, index=False)
+        return
+    
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pa_csv.write_csv(table, filename)
+    except pa.ArrowException:
+        # Mixed-type object columns can't be converted; use the pandas writer
+        df.to_csv(filename, index=False)
+        return
+    
+    try:
+        df.to_parquet(os.path.splitext(filename)[0] + '.parquet', engine='pyarrow', compression='zstd', index=False)
+    except Exception as e:
+        print(f"⚠️ Parquet save skipped: {e}")
+
 def get_comprehensive_data():
     """Get comprehensive data from multiple searches with error handling"""
     
     print("🔍 Starting comprehensive data collection...")
     
-    if not os.getenv('RAPIDAPI_KEY'):
+    if not _API_KEY:
         print("❌ No RAPIDAPI_KEY found in .env file")
         return None
     
-    zillow = ZillowDataCollector()
     all_houses = []
     
     # Search multiple areas and price ranges
@@ -478,70 +857,74 @@ def get_comprehensive_data():
         {"max_price": 400000, "min_beds": 4},
     ]
     
-    for i, config in enumerate(search_configs):
-        print(f"\n📡 Search {i+1}/{len(search_configs)}: ${config['max_price']:,}, {config['min_beds']}+ beds")
-        
-        try:
-            houses = zillow.search_minneapolis_houses(
-                max_price=config['max_price'],
-                min_beds=config['min_beds']
-            )
+    with ZillowDataCollector() as zillow:
+        for i, config in enumerate(search_configs):
+            print(f"\n📡 Search {i+1}/{len(search_configs)}: ${config['max_price']:,}, {config['min_beds']}+ beds")
             
-            if houses:
-                print(f"   ✅ Found {len(houses)} houses")
-                all_houses.extend(houses)
-            else:
-                print(f"   ⚠️ No houses found")
+            try:
+                houses = zillow.search_minneapolis_houses(
+                    max_price=config['max_price'],
+                    min_beds=config['min_beds']
+                )
             
-            # Rate limiting
-            time.sleep(3)
+                if houses:
+                    print(f"   ✅ Found {len(houses)} houses")
+                    all_houses.extend(houses)
+                else:
+                    print(f"   ⚠️ No houses found")
             
-        except Exception as e:
-            print(f"   ❌ Error: {e}")
-            continue
+                # Rate limiting
+                time.sleep(3)
+            
+            except Exception as e:
+                print(f"   ❌ Error: {e}")
+                continue
     
     if not all_houses:
         print("❌ No houses collected")
         return None
     
     # Remove duplicates based on zpid
-    df = pd.DataFrame(all_houses)
+    df = pd.DataFrame.from_records(all_houses, columns=list(HOUSE_SCHEMA)).astype(HOUSE_SCHEMA)
     df = df.drop_duplicates(subset=['zpid'], keep='first')
     
     print(f"\n🎯 Total unique houses collected: {len(df)}")
     
     # Score all houses with error handling
     scorer = AdvancedHouseScorer()
-    scored_houses = []
+    score_rows = []
     
     print("🎯 Scoring all houses...")
     
-    for i, house in enumerate(df.to_dict('records')):
+    # Clean every house in one vectorized pass, then score row by row
+    df = df.reset_index(drop=True)
+    cleaned_houses = AdvancedHouseScorer.clean_frame(df).to_dict('records')
+    
+    for i, (house, cleaned_house) in enumerate(zip(df.to_dict('records'), cleaned_houses)):
         try:
-            scores = scorer.score_house(house)
-            house_with_scores = {**house, **scores}
-            scored_houses.append(house_with_scores)
+            score_rows.append(scorer.score_house(house, cleaned_house))
             
             if i % 10 == 0:  # Progress update every 10 houses
                 print(f"   Scored {i+1}/{len(df)} houses...")
                 
         except Exception as e:
-            print(f"⚠️ Scoring error for house {i+1}: {e}")
-            # Add house without scores
-            house['overall_score'] = 0
-            house['meets_requirements'] = False
-            house['recommendation'] = "❌ Scoring failed"
-            scored_houses.append(house)
+            logger.debug("Scoring error for house %d: %s", i + 1, e)
+            # Keep the house without scores
+            score_rows.append({
+                'overall_score': 0,
+                'meets_requirements': False,
+                'recommendation': "❌ Scoring failed"
+            })
             continue
     
-    # Save comprehensive data
-    if scored_houses:
-        comprehensive_df = pd.DataFrame(scored_houses)
+    # Save comprehensive data; scores are joined onto the typed frame so HOUSE_SCHEMA dtypes survive
+    if score_rows:
+        comprehensive_df = df.join(pd.DataFrame(score_rows, index=df.index))
         comprehensive_df = comprehensive_df.sort_values('overall_score', ascending=False)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M")
         filename = f'comprehensive_houses_{timestamp}.csv'
-        comprehensive_df.to_csv(filename, index=False)
+        save_houses_frame(comprehensive_df, filename)
         
         print(f"\n💾 Saved {len(comprehensive_df)} scored houses to {filename}")
         
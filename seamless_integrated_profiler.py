@@ -13,8 +13,12 @@ st.set_page_config(
 
 import pandas as pd
 import json
+import hashlib
 import requests
 import os
+import re
+import uuid
+from pathlib import Path
 from typing import Dict, List
 from datetime import datetime
 from dotenv import load_dotenv
@@ -26,6 +30,29 @@ load_dotenv()
 GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 GROQ_MODEL = "llama3-70b-8192"
 
+# File-backed session store so results survive restarts and reloads
+SESSION_DIR = Path(".hh_sessions")
+PERSISTED_SESSION_KEYS = (
+    "quiz_answers", "selected_params", "param_weights",
+    "recommendations", "analysis_complete", "generated_profile", "ts_on_generate"
+)
+
+# Keyed quiz widgets, persisted alongside the results so a restore shows the same answers
+QUIZ_SELECT_DEFAULTS = {
+    "buyer_type": "First-time buyer",
+    "timeline": "1-3 months",
+    "work_situation": "Hybrid work",
+    "budget_flexibility": "Somewhat flexible"
+}
+QUIZ_WIDGET_KEYS = (
+    tuple(QUIZ_SELECT_DEFAULTS)
+    + tuple(f"p{i}" for i in range(1, 16))
+    + tuple(f"db{i}" for i in range(1, 11))
+)
+
+# Session ids are uuid4 hex strings; anything else from the URL is replaced
+_SESSION_ID_RE = re.compile(r'[0-9a-f]{32}')
+
 # Embedded parameter definitions (no external imports needed)
 PARAMETERS = {
     "💰 Financial & Market": {
@@ -451,12 +478,39 @@ class HouseProfileGenerator:
             "Content-Type": "application/json"
         }
     
-    def generate_profile(self, selected_params: Dict, param_weights: Dict, user_context: Dict) -> Dict:
-        """Generate comprehensive house profile using AI"""
+    def generate_profile_stream(self, selected_params: Dict, param_weights: Dict, user_context: Dict):
+        """Generate the house profile, yielding text chunks as they arrive"""
+        
+        data = self._build_request(selected_params, param_weights, user_context)
+        data["stream"] = True
+        
+        with requests.post(
+            GROQ_API_URL,
+            headers=self.headers,
+            json=data,
+            timeout=45,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                raise RuntimeError(f"API error: {response.status_code}")
+            
+            # Server-sent events: one "data: {...}" line per chunk
+            for line in response.iter_lines(decode_unicode=True):
+                if not line or not line.startswith("data: "):
+                    continue
+                payload = line[len("data: "):]
+                if payload == "[DONE]":
+                    break
+                delta = json.loads(payload)['choices'][0].get('delta', {})
+                if delta.get('content'):
+                    yield delta['content']
+    
+    def _build_request(self, selected_params: Dict, param_weights: Dict, user_context: Dict) -> Dict:
+        """Build the chat completion request body"""
         
         prompt = self._create_detailed_prompt(selected_params, param_weights, user_context)
         
-        data = {
+        return {
             "model": GROQ_MODEL,
             "messages": [
                 {
@@ -468,24 +522,6 @@ class HouseProfileGenerator:
             "temperature": 0.7,
             "max_tokens": 3500
         }
-        
-        try:
-            response = requests.post(
-                GROQ_API_URL,
-                headers=self.headers,
-                json=data,
-                timeout=45
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                content = result['choices'][0]['message']['content']
-                return {"success": True, "profile": content}
-            else:
-                return {"success": False, "error": f"API error: {response.status_code}"}
-                
-        except Exception as e:
-            return {"success": False, "error": str(e)}
     
     def _create_detailed_prompt(self, selected_params: Dict, param_weights: Dict, user_context: Dict) -> str:
         """Create comprehensive prompt for AI profile generation"""
@@ -576,6 +612,58 @@ Make every recommendation specific and actionable. Reference the parameter weigh
                 return params[param_key]
         return {"name": param_key}
 
+def get_session_id() -> str:
+    """Return the session id from the URL, creating one if missing"""
+    session_id = st.query_params.get("session_id")
+    if not session_id or not _SESSION_ID_RE.fullmatch(session_id):
+        session_id = uuid.uuid4().hex
+        st.query_params["session_id"] = session_id
+    return session_id
+
+def save_session(session_id: str):
+    """Persist the workflow results and quiz widget values for this session to disk"""
+    keys = PERSISTED_SESSION_KEYS + QUIZ_WIDGET_KEYS
+    data = {key: st.session_state[key] for key in keys if key in st.session_state}
+    payload = json.dumps(data)
+    try:
+        SESSION_DIR.mkdir(exist_ok=True)
+        (SESSION_DIR / f"{session_id}.json").write_text(payload)
+    except OSError:
+        pass  # Persistence is best-effort
+
+def load_session(session_id: str) -> bool:
+    """Restore persisted workflow results and quiz widget values into session state"""
+    path = SESSION_DIR / f"{session_id}.json"
+    if not path.exists():
+        return False
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return False
+    for key, value in data.items():
+        st.session_state.setdefault(key, value)
+    return True
+
+def answers_cache_key(answers: Dict) -> str:
+    """Stable hash of the quiz answers, computed once per rerun"""
+    return hashlib.sha256(json.dumps(answers, sort_keys=True, default=str).encode()).hexdigest()
+
+@st.cache_data
+def analyze_answers(answers_key: str, _answers: Dict) -> tuple:
+    """Cached parameter analysis; only answers_key is hashed by Streamlit"""
+    return ParameterAnalyzer().analyze_quiz_responses(_answers)
+
+@st.cache_data
+def encode_config(answers_key: str, _answers: Dict, _params: Dict, _weights: Dict, timestamp: str) -> bytes:
+    """Encode the downloadable configuration once per answers/timestamp"""
+    config = {
+        "quiz_answers": _answers,
+        "selected_params": _params,
+        "param_weights": _weights,
+        "generated_date": timestamp
+    }
+    return json.dumps(config, indent=2).encode()
+
 def create_comprehensive_quiz():
     """Create the complete assessment quiz with immediate processing"""
     
@@ -588,6 +676,10 @@ def create_comprehensive_quiz():
     
     answers = st.session_state.quiz_answers
     
+    # Select defaults go through session state so restored values take precedence
+    for key, value in QUIZ_SELECT_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
+    
     # Section 1: Basic Profile
     with st.expander("👤 Your Profile", expanded=True):
         col1, col2 = st.columns(2)
@@ -597,14 +689,12 @@ def create_comprehensive_quiz():
                 "I am a...",
                 ["First-time buyer", "Family with kids", "Empty nesters", 
                  "Young professional", "Remote worker", "Investor", "Other"],
-                index=0,
                 key="buyer_type"
             )
             
             timeline = st.selectbox(
                 "Planning to buy within...",
                 ["ASAP", "1-3 months", "3-6 months", "6-12 months", "Just exploring"],
-                index=1,
                 key="timeline"
             )
         
@@ -613,14 +703,12 @@ def create_comprehensive_quiz():
                 "Work situation",
                 ["Fixed office location", "Hybrid work", "Fully remote", 
                  "Multiple locations", "Retired", "Self-employed"],
-                index=1,
                 key="work_situation"
             )
             
             budget_flexibility = st.selectbox(
                 "Budget flexibility",
                 ["Very tight", "Somewhat flexible", "Pretty flexible", "Very flexible"],
-                index=1,
                 key="budget_flexibility"
             )
     
@@ -801,6 +889,12 @@ def main():
     st.title("🏡 AI-Powered House Profile Generator")
     st.markdown("*Complete workflow: Assessment → Analysis → AI Profile*")
     
+    # Restore a previous session (e.g. after a server restart) once per browser session
+    session_id = get_session_id()
+    if not st.session_state.get('session_restored'):
+        load_session(session_id)
+        st.session_state.session_restored = True
+    
     # Check for API key
     api_key = os.getenv('GROQ_API_KEY') or os.getenv('RAPIDAPI_KEY')
     
@@ -832,24 +926,28 @@ def main():
         st.info("👆 Complete the assessment above to continue")
         return
     
+    st.session_state.answers_key = answers_cache_key(answers)
+    
     # Step 2: Generate Analysis Button
     st.markdown("## Step 2: Scientific Analysis")
     
     if st.button("🧠 Generate Parameter Analysis", type="primary", help="Analyze your responses scientifically"):
         with st.spinner("Analyzing your responses and generating parameter weights..."):
             
-            # Initialize analyzer and process quiz
-            analyzer = ParameterAnalyzer()
-            selected_params, param_weights, recommendations = analyzer.analyze_quiz_responses(answers)
+            # Process quiz (cached on the answers hash)
+            selected_params, param_weights, recommendations = analyze_answers(
+                st.session_state.answers_key, answers
+            )
             
             # Store in session state
             st.session_state.selected_params = selected_params
             st.session_state.param_weights = param_weights
             st.session_state.recommendations = recommendations
             st.session_state.analysis_complete = True
+            save_session(session_id)
             
         st.success("✅ Parameter analysis complete!")
-        st.rerun()  # Refresh to show results
+        # Results render below in this same run; no st.rerun() needed
     
     # Step 3: Show Analysis Results
     if st.session_state.get('analysis_complete', False):
@@ -862,40 +960,48 @@ def main():
         # Step 4: Generate AI Profile
         st.markdown("## Step 3: AI Profile Generation")
         
+        profile_streamed = False
         if st.button("🎨 Generate My House Hunting Profile", type="primary"):
             if not api_key:
                 st.error("❌ Please enter your Groq API key in the sidebar first!")
                 return
                 
-            with st.spinner("Creating your personalized house hunting profile with AI..."):
-                
-                generator = HouseProfileGenerator(api_key)
-                result = generator.generate_profile(
-                    st.session_state.selected_params,
-                    st.session_state.param_weights,
-                    answers
+            st.markdown("## 🎯 Your Personalized House Hunting Profile")
+            generator = HouseProfileGenerator(api_key)
+            
+            try:
+                st.session_state.generated_profile = st.write_stream(
+                    generator.generate_profile_stream(
+                        st.session_state.selected_params,
+                        st.session_state.param_weights,
+                        answers
+                    )
                 )
-                
-                if result['success']:
-                    st.session_state.generated_profile = result['profile']
-                    st.success("✅ Profile generated successfully!")
-                else:
-                    st.error(f"Error generating profile: {result['error']}")
+                st.session_state.ts_on_generate = datetime.now().strftime("%Y%m%d_%H%M%S")
+                save_session(session_id)
+                profile_streamed = True
+                st.success("✅ Profile generated successfully!")
+            except Exception as e:
+                st.error(f"Error generating profile: {e}")
         
         # Step 5: Display Generated Profile
         if st.session_state.get('generated_profile'):
-            st.markdown("## 🎯 Your Personalized House Hunting Profile")
-            
-            # Display the profile
-            st.markdown(st.session_state.generated_profile)
+            # Display the profile (already rendered if it was just streamed)
+            if not profile_streamed:
+                st.markdown("## 🎯 Your Personalized House Hunting Profile")
+                st.markdown(st.session_state.generated_profile)
             
             # Download options
             st.markdown("### 💾 Save Your Profile")
             
             col1, col2, col3 = st.columns(3)
             
+            # Stable per-profile timestamp keeps the encoded config cached across reruns
+            if 'ts_on_generate' not in st.session_state:
+                st.session_state.ts_on_generate = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = st.session_state.ts_on_generate
+            
             with col1:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"house_profile_{timestamp}.txt"
                 st.download_button(
                     "📄 Download Profile",
@@ -905,13 +1011,13 @@ def main():
                 )
             
             with col2:
-                config = {
-                    "quiz_answers": answers,
-                    "selected_params": st.session_state.selected_params,
-                    "param_weights": st.session_state.param_weights,
-                    "generated_date": timestamp
-                }
-                config_json = json.dumps(config, indent=2)
+                config_json = encode_config(
+                    st.session_state.answers_key,
+                    answers,
+                    st.session_state.selected_params,
+                    st.session_state.param_weights,
+                    timestamp
+                )
                 st.download_button(
                     "⚙️ Save Configuration",
                     config_json,
@@ -944,46 +1050,54 @@ def main():
     
     # Sidebar with workflow status
     with st.sidebar:
-        st.header("🔄 Workflow Status")
-        
-        # Step indicators
-        if answers:
-            st.success("✅ Step 1: Assessment Complete")
-        else:
-            st.info("📝 Step 1: Complete Assessment")
-        
-        if st.session_state.get('analysis_complete', False):
-            st.success("✅ Step 2: Analysis Complete")
-        else:
-            st.info("🧠 Step 2: Generate Analysis")
-        
-        if st.session_state.get('generated_profile'):
-            st.success("✅ Step 3: Profile Complete")
-        else:
-            st.info("🎨 Step 3: Generate Profile")
-        
-        # Quick stats if analysis is done
-        if st.session_state.get('param_weights'):
-            st.markdown("### 📊 Quick Stats")
-            total_params = len(st.session_state.param_weights)
-            high_priority = len(st.session_state.recommendations["high_priority"])
-            
-            st.metric("Parameters", total_params)
-            st.metric("High Priority", high_priority)
-            
-            # Top 3 parameters
-            sorted_params = sorted(st.session_state.param_weights.items(), 
-                                 key=lambda x: x[1], reverse=True)
-            
-            st.markdown("**Top 3 Priorities:**")
-            for i, (param_key, weight) in enumerate(sorted_params[:3]):
-                param_info = None
-                for category, params in PARAMETERS.items():
-                    if param_key in params:
-                        param_info = params[param_key]
-                        break
-                param_name = param_info['name'] if param_info else param_key
-                st.caption(f"{i+1}. {param_name} ({weight:.1%})")
+        _sidebar_status(answers)
+        _sidebar_stats()
+
+def _sidebar_status(answers: Dict):
+    """Sidebar workflow step indicators"""
+    st.header("🔄 Workflow Status")
+    
+    # Step indicators
+    if answers:
+        st.success("✅ Step 1: Assessment Complete")
+    else:
+        st.info("📝 Step 1: Complete Assessment")
+    
+    if st.session_state.get('analysis_complete', False):
+        st.success("✅ Step 2: Analysis Complete")
+    else:
+        st.info("🧠 Step 2: Generate Analysis")
+    
+    if st.session_state.get('generated_profile'):
+        st.success("✅ Step 3: Profile Complete")
+    else:
+        st.info("🎨 Step 3: Generate Profile")
+
+def _sidebar_stats():
+    """Sidebar quick stats once the analysis is done"""
+    if not st.session_state.get('param_weights'):
+        return
+    
+    st.markdown("### 📊 Quick Stats")
+    total_params = len(st.session_state.param_weights)
+    high_priority = len(st.session_state.recommendations["high_priority"])
+    
+    st.metric("Parameters", total_params)
+    st.metric("High Priority", high_priority)
+    
+    # Top 3 parameters
+    sorted_params = sorted(st.session_state.param_weights.items(), 
+                         key=lambda x: x[1], reverse=True)
+    
+    st.markdown("**Top 3 Priorities:**")
+    for i, (param_key, weight) in enumerate(sorted_params[:3]):
+        param_info = None
+        for category, params in PARAMETERS.items():
+            if param_key in params:
+                param_info = params[param_key]
+                break
+        param_name = param_info['name'] if param_info else param_key
+        st.caption(f"{i+1}. {param_name} ({weight:.1%})")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,13 +1,125 @@
 # streamlit_app.py
+import os
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from quick_start_scorer import QuickHouseScorer, analyze_houses
+import numpy as np
 
 st.set_page_config(page_title="AI House Hunter", page_icon="🏠", layout="wide")
 
+SCORE_CATS = ['Price', 'Commute', 'Size', 'Age', 'Value', 'Requirements']
+
+# Listings file analyze_houses() scores; its stat keys the cached charts
+HOUSES_FILE = 'collected_houses.csv'
+
+# Narrow dtypes for the analysis frame (halves memory for column scans)
+_NUMERIC_DTYPES = {'price': 'int32', 'sqft': 'int32', 'bedrooms': 'int8', 'year_built': 'int16'}
+
+def _fits_integer(values, dtype):
+    """True when every value is a whole number inside dtype's range"""
+    info = np.iinfo(dtype)
+    return bool(np.all(values == np.floor(values)) and values.min() >= info.min and values.max() <= info.max)
+
+def _downcast_results(df):
+    """Downcast integer columns and *_score columns of the analysis DataFrame"""
+    for col, dtype in _NUMERIC_DTYPES.items():
+        if col not in df.columns or len(df) == 0 or not pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        values = df[col].to_numpy(dtype='float64', na_value=np.nan)
+        # Casting would wrap out-of-range values and truncate fractions, so leave those columns alone
+        if not np.isnan(values).any() and _fits_integer(values, dtype):
+            df[col] = df[col].astype(dtype)
+    
+    score_cols = [c for c in df.columns if c.endswith('_score')]
+    if score_cols:
+        df[score_cols] = df[score_cols].astype('float32')
+    return df
+
+def _source_key():
+    """(mtime_ns, size) of the listings file, a cheap cache key for figures built from its analysis"""
+    try:
+        st_info = os.stat(HOUSES_FILE)
+        return st_info.st_mtime_ns, st_info.st_size
+    except FileNotFoundError:
+        return None
+
+@st.cache_resource
+def _score_fig_template():
+    """Score breakdown chart, built once and copied per house"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Bar(x=SCORE_CATS, marker=dict(colorscale='RdYlGn')))
+    fig.update_layout(title_text="Score Breakdown", height=300, showlegend=False)
+    return fig
+
+@st.cache_resource
+def _build_charts(source_key, _df):
+    """Build the market overview figures once per version of the listings file"""
+    import plotly.express as px
+    
+    # Bin prices here so the browser only receives the 10 bar heights
+    prices = _df['price'].to_numpy(dtype='float64', na_value=np.nan)
+    counts, edges = np.histogram(prices[~np.isnan(prices)], bins=10)
+    fig_price = px.bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        title="Price Distribution",
+        labels={'x': 'price', 'y': 'count'}
+    )
+    fig_price.update_traces(width=np.diff(edges))
+    fig_price.update_layout(height=300)
+    
+    fig_scatter = px.scatter(
+        _df,
+        x='price',
+        y='overall_score',
+        size='sqft',
+        color='overall_score',
+        title="Score vs Price",
+        color_continuous_scale='RdYlGn'
+    )
+    fig_scatter.update_layout(height=300)
+    return fig_price, fig_scatter
+
+def _detailed_analysis(viable_houses):
+    """Per-house detail cards"""
+    import plotly.graph_objects as go
+    
+    st.subheader("📋 Detailed Analysis")
+    
+    for idx, house in viable_houses.head(5).iterrows():
+        with st.expander(f"{house['address']} - Score: {house['overall_score']:.1%}"):
+            col_x, col_y = st.columns(2)
+            
+            with col_x:
+                st.write("**Property Details**")
+                st.write(f"Price: ${house['price']:,}")
+                st.write(f"Size: {house['sqft']} sqft")
+                st.write(f"Bedrooms: {house['bedrooms']}")
+                st.write(f"Year Built: {house['year_built']}")
+                st.write(f"Commute: ~{house.get('estimated_commute_minutes', 'N/A')} minutes")
+            
+            with col_y:
+                st.write("**Score Breakdown**")
+                
+                # Create score visualization from the shared template
+                scores = [
+                    house['price_score'],
+                    house['commute_score'], 
+                    house['size_score'],
+                    house['age_score'],
+                    house['value_score'],
+                    house['requirements_score']
+                ]
+                
+                fig = go.Figure(_score_fig_template())
+                fig.data[0].y = scores
+                fig.data[0].marker.color = scores
+                st.plotly_chart(fig, use_container_width=True)
+
 def main():
+    # Deferred so the scoring stack only loads when the page actually runs
+    from quick_start_scorer import QuickHouseScorer, analyze_houses
+    
     st.title("🏠 AI-Powered House Hunter")
     st.markdown("*Data-driven home search with personalized scoring*")
     
@@ -28,14 +140,19 @@ def main():
         
         update_prefs = st.button("Update Analysis")
     
+    # Load and analyze data once; both columns render from the same frame
+    try:
+        results_df = _downcast_results(analyze_houses())
+    except FileNotFoundError:
+        results_df = None
+    
     # Main content
     col1, col2 = st.columns([2, 1])
     
     with col1:
         st.header("📊 House Analysis")
         
-        # Load and analyze data
-        try:
+        if results_df is not None:
             # Create scorer with custom preferences
             scorer = QuickHouseScorer()
             scorer.max_budget = max_budget
@@ -49,9 +166,6 @@ def main():
             scorer.weights['commute'] = commute_weight
             scorer.weights['size'] = size_weight
             
-            # Analyze houses
-            results_df = analyze_houses()
-            
             if len(results_df) > 0:
                 # Filter viable houses
                 viable_houses = results_df[results_df['is_viable']]
@@ -93,51 +207,12 @@ def main():
                 )
                 
                 # Detailed house cards
-                st.subheader("📋 Detailed Analysis")
-                
-                for idx, house in viable_houses.head(5).iterrows():
-                    with st.expander(f"{house['address']} - Score: {house['overall_score']:.1%}"):
-                        col_x, col_y = st.columns(2)
-                        
-                        with col_x:
-                            st.write("**Property Details**")
-                            st.write(f"Price: ${house['price']:,}")
-                            st.write(f"Size: {house['sqft']} sqft")
-                            st.write(f"Bedrooms: {house['bedrooms']}")
-                            st.write(f"Year Built: {house['year_built']}")
-                            st.write(f"Commute: ~{house.get('estimated_commute_minutes', 'N/A')} minutes")
-                        
-                        with col_y:
-                            st.write("**Score Breakdown**")
-                            
-                            # Create score visualization
-                            score_data = {
-                                'Category': ['Price', 'Commute', 'Size', 'Age', 'Value', 'Requirements'],
-                                'Score': [
-                                    house['price_score'],
-                                    house['commute_score'], 
-                                    house['size_score'],
-                                    house['age_score'],
-                                    house['value_score'],
-                                    house['requirements_score']
-                                ]
-                            }
-                            
-                            fig = px.bar(
-                                score_data, 
-                                x='Category', 
-                                y='Score',
-                                title=f"Score Breakdown",
-                                color='Score',
-                                color_continuous_scale='RdYlGn'
-                            )
-                            fig.update_layout(height=300, showlegend=False)
-                            st.plotly_chart(fig, use_container_width=True)
+                _detailed_analysis(viable_houses)
             
             else:
                 st.warning("No house data found. Please run manual_data_collection.py first.")
         
-        except FileNotFoundError:
+        else:
             st.error("❌ No house data found!")
             st.info("👉 Please run `python manual_data_collection.py` first to create sample data")
     
@@ -145,30 +220,13 @@ def main():
         st.header("📈 Market Overview")
         
         try:
-            results_df = analyze_houses()
-            
-            if len(results_df) > 0:
+            if results_df is not None and len(results_df) > 0:
+                fig_price, fig_scatter = _build_charts(_source_key(), results_df)
+                
                 # Price distribution
-                fig_price = px.histogram(
-                    results_df, 
-                    x='price', 
-                    title="Price Distribution",
-                    nbins=10
-                )
-                fig_price.update_layout(height=300)
                 st.plotly_chart(fig_price, use_container_width=True)
                 
                 # Score vs Price scatter
-                fig_scatter = px.scatter(
-                    results_df,
-                    x='price',
-                    y='overall_score',
-                    size='sqft',
-                    color='overall_score',
-                    title="Score vs Price",
-                    color_continuous_scale='RdYlGn'
-                )
-                fig_scatter.update_layout(height=300)
                 st.plotly_chart(fig_scatter, use_container_width=True)
                 
                 # Key insights
@@ -176,8 +234,8 @@ def main():
                 
                 viable = results_df[results_df['is_viable']]
                 if len(viable) > 0:
-                    best_value = viable.loc[viable['value_score'].idxmax()]
-                    shortest_commute = viable.loc[viable['commute_score'].idxmax()]
+                    best_value = viable.iloc[np.nanargmax(viable['value_score'].to_numpy())]
+                    shortest_commute = viable.iloc[np.nanargmax(viable['commute_score'].to_numpy())]
                     
                     st.write(f"**Best Value**: {best_value['address'][:30]}...")
                     st.write(f"**Shortest Commute**: {shortest_commute['address'][:30]}...")
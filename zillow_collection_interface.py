@@ -1,106 +1,339 @@
 # zillow_collection_interface.py
 # Streamlit interface for managing the enhanced comprehensive_data_collector.py
 
+import gzip
+import io
+import os
 import streamlit as st
 import pandas as pd
+import numpy as np
 import sqlite3
+import threading
 from datetime import datetime, timedelta
-import plotly.express as px
-import plotly.graph_objects as go
 from comprehensive_data_collector import EnhancedDataCollector
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; a vectorized NumPy version is used instead
+    _HAVE_NUMBA = False
+
+try:
+    import pyarrow  # noqa: F401 - enables Arrow-backed frames from read_sql_query
+    _ARROW_BACKEND = True
+except ImportError:
+    _ARROW_BACKEND = False
+
+# Extra read_sql_query arguments for the houses reads
+_READ_KWARGS = {'dtype_backend': 'pyarrow'} if _ARROW_BACKEND else {}
+
 st.set_page_config(
     page_title="Comprehensive Data Collection Manager",
     page_icon="🏠",
     layout="wide"
 )
 
+# Columns the interface actually reads; everything else stays in SQLite
+HOUSE_COLUMNS = (
+    'address', 'price', 'bedrooms', 'bathrooms', 'sqft', 'neighborhood',
+    'overall_score', 'recommendation', 'last_updated', 'year_built', 'listing_url',
+    'price_score', 'commute_score', 'size_score', 'age_score', 'location_score'
+)
+_HOUSE_SELECT = ', '.join(HOUSE_COLUMNS)
+
+# House Browser sort options; also the whitelist for ORDER BY in query_houses
+SORT_COLUMNS = {
+    "Overall Score": "overall_score",
+    "Price": "price", 
+    "Last Updated": "last_updated",
+    "Bedrooms": "bedrooms",
+    "Square Feet": "sqft"
+}
+
+# Static UI option lists, built once at import instead of on every rerun
+TAB_LABELS = ("📊 Dashboard", "🏠 House Browser", "📈 Collection Analytics", "⚙️ Management")
+COLLECTION_STRATEGIES = ("Balanced (Collect + Validate)", "Collection Heavy", "Validation Heavy")
+TABLE_COLUMNS = (
+    'address', 'price', 'bedrooms', 'bathrooms', 'sqft',
+    'neighborhood', 'overall_score', 'recommendation', 'last_updated'
+)
+
+# Narrow dtypes for the loaded frames (numpy ints only when the column has no NULLs;
+# Arrow-backed columns are nullable so they are always narrowed)
+HOUSE_DTYPES = {
+    'price': 'int32',
+    'bedrooms': 'int8',
+    'bathrooms': 'float32',
+    'sqft': 'int32',
+    'year_built': 'int16',
+    'overall_score': 'float32',
+    'price_score': 'float32',
+    'commute_score': 'float32',
+    'size_score': 'float32',
+    'age_score': 'float32',
+    'location_score': 'float32'
+}
+
+# Low-cardinality text columns stored as categoricals (int codes + small dictionary)
+CATEGORY_COLUMNS = ('neighborhood', 'recommendation')
+
+def _narrow_dtypes(df):
+    """Downcast HOUSE_DTYPES, categorize CATEGORY_COLUMNS and parse last_updated of a freshly read houses frame"""
+    if 'last_updated' in df.columns:
+        df['last_updated'] = pd.to_datetime(df['last_updated'], format='ISO8601', errors='coerce')
+    
+    for col, dtype in HOUSE_DTYPES.items():
+        if col not in df.columns:
+            continue
+        if _ARROW_BACKEND:
+            df[col] = df[col].astype(f"{dtype}[pyarrow]")
+        elif dtype.startswith('float') or df[col].notna().all():
+            df[col] = df[col].astype(dtype)
+    
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    return df
+
 @st.cache_resource
 def get_collector():
     """Get enhanced collector instance"""
     return EnhancedDataCollector(max_calls_per_session=5)
 
-def load_database_data():
-    """Load data from the comprehensive houses SQLite database"""
+@st.cache_resource
+def _thread_conns(db_path):
+    """Per-thread connection slots; one sqlite3 connection must not serve concurrent sessions"""
+    return threading.local()
+
+def get_conn(db_path):
+    """Autocommit connection in WAL mode for the calling script thread, reused across its queries"""
     
-    try:
-        collector = get_collector()
-        conn = sqlite3.connect(collector.db_path)
-        
-        # Load active houses with all scoring data
-        houses_df = pd.read_sql_query('''
-            SELECT * FROM houses 
-            WHERE is_active = 1 
-            ORDER BY overall_score DESC, last_updated DESC
-        ''', conn)
-        
-        # Load collection activity log
-        activity_df = pd.read_sql_query('''
+    local = _thread_conns(db_path)
+    conn = getattr(local, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")  # readers don't block a running collection
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        local.conn = conn
+    return conn
+
+def db_fingerprint(db_path):
+    """(mtime_ns, size) of the database and its WAL file, used to key the cached loaders
+    
+    Any write (including is_active flips that leave last_updated alone) changes
+    one of the two files, so cached frames invalidate without querying SQLite.
+    """
+    
+    fingerprint = []
+    for path in (db_path, db_path + '-wal'):
+        try:
+            st_info = os.stat(path)
+            fingerprint.append((st_info.st_mtime_ns, st_info.st_size))
+        except FileNotFoundError:
+            fingerprint.append(None)
+    return tuple(fingerprint)
+
+@st.cache_data(ttl=60)
+def _read_tables(db_path, fingerprint):
+    """Read houses and collection log once per database fingerprint"""
+    
+    conn = get_conn(db_path)
+    
+    # Load active houses with all scoring data
+    houses_df = _narrow_dtypes(pd.read_sql_query(f'''
+        SELECT {_HOUSE_SELECT} FROM houses 
+        WHERE is_active = 1 
+        ORDER BY overall_score DESC, last_updated DESC
+    ''', conn, **_READ_KWARGS))
+    
+    # Load the last 30 days of the collection log, oldest first so charts get
+    # an already-ordered x axis (SQLite sorts; pandas never does)
+    activity_df = pd.read_sql_query('''
+        SELECT * FROM (
             SELECT * FROM collection_log 
             ORDER BY date DESC
             LIMIT 30
-        ''', conn)
-        
-        conn.close()
-        
-        return houses_df, activity_df
+        ) ORDER BY date
+    ''', conn, parse_dates=['date'])
+    
+    meta = _frame_meta(houses_df)
+    meta['fingerprint'] = fingerprint  # cache key for the figures built from these frames
+    return houses_df, activity_df, meta
+
+def _frame_meta(houses_df):
+    """Widget bounds/options derived once per load instead of on every widget render"""
+    
+    meta = {
+        'rows': len(houses_df),
+        'columns': tuple(houses_df.columns),
+        'price_min': 0,
+        'price_max': 0,
+        'neighborhoods': [],
+        'fingerprint': None
+    }
+    
+    if 'price' in houses_df.columns:
+        prices = houses_df['price'].to_numpy(dtype='float64', na_value=np.nan)
+        if np.isfinite(prices).any():
+            meta['price_min'] = int(np.nanmin(prices))
+            meta['price_max'] = int(np.nanmax(prices))
+    
+    if 'neighborhood' in houses_df.columns:
+        neighborhoods = houses_df['neighborhood']
+        if isinstance(neighborhoods.dtype, pd.CategoricalDtype):
+            meta['neighborhoods'] = sorted(neighborhoods.cat.categories.tolist())
+        else:
+            meta['neighborhoods'] = sorted(neighborhoods.dropna().unique().tolist())
+    
+    return meta
+
+def load_database_data():
+    """Load data from the comprehensive houses SQLite database"""
+    
+    try:
+        db_path = get_collector().db_path
+        return _read_tables(db_path, db_fingerprint(db_path))
         
     except Exception as e:
         st.error(f"Error loading database: {e}")
-        return pd.DataFrame(), pd.DataFrame()
+        return pd.DataFrame(), pd.DataFrame(), _frame_meta(pd.DataFrame())
 
-def get_database_stats():
-    """Get comprehensive database statistics"""
+@st.cache_resource
+def ensure_indexes(db_path):
+    """Create the indexes the House Browser queries rely on (once per process)"""
+    
+    conn = get_conn(db_path)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_houses_active_score ON houses(is_active, overall_score DESC)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_houses_price_beds ON houses(price, bedrooms)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_houses_neighborhood ON houses(neighborhood)")
+    return True
+
+def _house_filter(price_range, min_beds, neighborhoods, min_score):
+    """Build the WHERE clause and parameters shared by the House Browser queries"""
+    
+    where = "is_active = 1 AND price BETWEEN ? AND ? AND bedrooms >= ? AND overall_score >= ?"
+    params = [price_range[0], price_range[1], min_beds, min_score]
+    
+    if neighborhoods:
+        where += f" AND neighborhood IN ({', '.join('?' * len(neighborhoods))})"
+        params.extend(neighborhoods)
+    
+    return where, params
+
+def count_houses(price_range, min_beds, neighborhoods, min_score):
+    """Count active houses matching the browser filters"""
+    
+    where, params = _house_filter(price_range, min_beds, neighborhoods, min_score)
     
     try:
-        collector = get_collector()
-        conn = sqlite3.connect(collector.db_path)
-        cursor = conn.cursor()
-        
-        # Total and active houses
-        cursor.execute("SELECT COUNT(*) FROM houses")
-        total_houses = cursor.fetchone()[0]
+        db_path = get_collector().db_path
+        ensure_indexes(db_path)
+        return get_conn(db_path).execute(f"SELECT COUNT(*) FROM houses WHERE {where}", params).fetchone()[0]
         
-        cursor.execute("SELECT COUNT(*) FROM houses WHERE is_active = 1")
-        active_houses = cursor.fetchone()[0]
+    except Exception as e:
+        st.error(f"Error counting houses: {e}")
+        return 0
+
+def query_houses(price_range, min_beds, neighborhoods, min_score, sort_col="overall_score", limit=50, offset=0, columns=_HOUSE_SELECT):
+    """Fetch one filtered, sorted page of active houses directly from SQLite
+    
+    Pass limit=None to fetch every match and columns='*' to keep every
+    houses column (used for exports).
+    """
+    
+    where, params = _house_filter(price_range, min_beds, neighborhoods, min_score)
+    
+    # Never interpolate a column name that isn't whitelisted
+    if sort_col not in SORT_COLUMNS.values():
+        sort_col = "overall_score"
+    
+    sql = f"SELECT {columns} FROM houses WHERE {where} ORDER BY {sort_col} DESC"
+    if limit is not None:
+        sql += " LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+    
+    try:
+        db_path = get_collector().db_path
+        ensure_indexes(db_path)
+        return _narrow_dtypes(pd.read_sql_query(sql, get_conn(db_path), params=params, **_READ_KWARGS))
         
-        # Recent activity (last 7 days)
-        cutoff_date = (datetime.now() - timedelta(days=7)).isoformat()
-        cursor.execute("SELECT COUNT(*) FROM houses WHERE last_updated > ?", (cutoff_date,))
-        recent_houses = cursor.fetchone()[0]
+    except Exception as e:
+        st.error(f"Error querying houses: {e}")
+        return pd.DataFrame()
+
+@st.cache_data(ttl=30)
+def db_size_mb(db_path):
+    """Database file size in MB (file metadata changes on the order of minutes)"""
+    return os.path.getsize(db_path) / 1024 / 1024
+
+@st.cache_data(ttl=15)
+def _activity_counts(db_path, fingerprint, cutoff_date, today):
+    """Totals, recent (last 7 days) and today's activity in one statement"""
+    return get_conn(db_path).execute("""
+        SELECT COUNT(*),
+               COALESCE(SUM(CASE WHEN last_updated > :cutoff THEN 1 ELSE 0 END), 0),
+               (SELECT api_calls_made FROM collection_log WHERE date = :today),
+               (SELECT houses_collected FROM collection_log WHERE date = :today),
+               (SELECT efficiency_ratio FROM collection_log WHERE date = :today)
+        FROM houses
+    """, {"cutoff": cutoff_date, "today": today}).fetchone()
+
+def _top_categories(series, n):
+    """(label, count) pairs for the n most frequent values, via a bincount over category codes"""
+    
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return list(series.value_counts().head(n).items())
+    
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    if counts.size == 0:
+        return []
+    
+    top = np.argpartition(-counts, min(n, counts.size) - 1)[:n]
+    top = top[np.argsort(-counts[top], kind='stable')]
+    labels = series.cat.categories.to_numpy()[top]
+    return [(label, int(count)) for label, count in zip(labels, counts[top]) if count > 0]
+
+def get_database_stats(houses_df):
+    """Get comprehensive database statistics
+    
+    Price and neighborhood figures come from the already loaded active
+    houses frame; only the counts that need inactive rows or the log hit SQL.
+    """
+    
+    try:
+        # Cutoff rounded to the minute so the cached counts can be reused
+        cutoff_date = (datetime.now() - timedelta(days=7)).replace(second=0, microsecond=0).isoformat()
+        today = datetime.now().date().isoformat()
         
-        # Price statistics
-        cursor.execute("""
-            SELECT MIN(price), MAX(price), AVG(price), COUNT(*) 
-            FROM houses WHERE is_active = 1 AND price > 0
-        """)
-        price_stats = cursor.fetchone()
+        db_path = get_collector().db_path
+        row = _activity_counts(db_path, db_fingerprint(db_path), cutoff_date, today)
         
-        # Top neighborhoods
-        cursor.execute("""
-            SELECT neighborhood, COUNT(*) as count 
-            FROM houses WHERE is_active = 1 
-            GROUP BY neighborhood 
-            ORDER BY count DESC 
-            LIMIT 5
-        """)
-        top_neighborhoods = cursor.fetchall()
+        total_houses, recent_houses = row[0], row[1]
+        today_activity = row[2:] if row[2] is not None else None
         
-        # Today's activity
-        today = datetime.now().date().isoformat()
-        cursor.execute("SELECT api_calls_made, houses_collected, efficiency_ratio FROM collection_log WHERE date = ?", (today,))
-        today_activity = cursor.fetchone()
+        # Price statistics and top neighborhoods in one pass over the frame
+        # (one boolean mask over the raw array; NaN > 0 is False so missing prices drop out too)
+        priced = np.empty(0)
+        if 'price' in houses_df.columns:
+            prices = houses_df['price'].to_numpy(dtype='float64', na_value=np.nan)
+            priced = prices[prices > 0]
         
-        conn.close()
+        top_neighborhoods = []
+        if 'neighborhood' in houses_df.columns:
+            top_neighborhoods = _top_categories(houses_df['neighborhood'], 5)
         
         return {
             "total_houses": total_houses,
-            "active_houses": active_houses,
+            "active_houses": len(houses_df),
             "recent_houses": recent_houses,
-            "price_min": price_stats[0] if price_stats[0] else 0,
-            "price_max": price_stats[1] if price_stats[1] else 0,
-            "price_avg": price_stats[2] if price_stats[2] else 0,
-            "priced_houses": price_stats[3] if price_stats[3] else 0,
+            "price_min": priced.min() if priced.size else 0,
+            "price_max": priced.max() if priced.size else 0,
+            "price_avg": priced.mean() if priced.size else 0,
+            "priced_houses": int(priced.size),
             "top_neighborhoods": top_neighborhoods,
             "today_calls": today_activity[0] if today_activity else 0,
             "today_houses": today_activity[1] if today_activity else 0,
@@ -111,6 +344,205 @@ def get_database_stats():
         st.error(f"Error getting database stats: {e}")
         return {}
 
+if _HAVE_NUMBA:
+    @njit(cache=True)
+    def _house_stats(price, sqft, score):
+        """Average $/sqft, average score and scored-house count in one pass"""
+        n_pps = 0
+        sum_pps = 0.0
+        n_scored = 0
+        sum_score = 0.0
+        
+        for i in range(price.size):
+            if sqft[i] > 0 and not np.isnan(price[i]):
+                sum_pps += price[i] / sqft[i]
+                n_pps += 1
+            if not np.isnan(score[i]):
+                sum_score += score[i]
+                n_scored += 1
+        
+        return sum_pps / max(n_pps, 1), sum_score / max(n_scored, 1), n_scored
+else:
+    def _house_stats(price, sqft, score):
+        """Average $/sqft, average score and scored-house count with masked NumPy reductions"""
+        valid = (sqft > 0) & ~np.isnan(price)
+        price_per_sqft = price[valid] / sqft[valid]
+        scored = score[~np.isnan(score)]
+        
+        avg_pps = price_per_sqft.mean() if price_per_sqft.size else 0.0
+        avg_score = scored.mean() if scored.size else 0.0
+        return avg_pps, avg_score, scored.size
+
+CARD_SCORE_FIELDS = ('price_score', 'commute_score', 'size_score', 'age_score', 'location_score')
+
+def _card_markdown(house):
+    """Render one house card as three markdown blocks (details, analysis, breakdown)"""
+    
+    details = [
+        "**🏠 Property Details**",
+        f"📍 **Address:** {house.get('address', 'N/A')}",
+        f"💰 **Price:** ${house.get('price', 0):,.0f}",
+        f"🏠 **Layout:** {house.get('bedrooms', 0)} bed, {house.get('bathrooms', 0)} bath",
+        f"📐 **Size:** {house.get('sqft', 0):,} sqft",
+        f"📅 **Built:** {house.get('year_built', 'N/A')}",
+        f"🏘️ **Area:** {house.get('neighborhood', 'N/A')}"
+    ]
+    if house.get('listing_url'):
+        details.append(f"🔗 **[View on Zillow]({house['listing_url']})**")
+    
+    analysis = ["**🎯 AI Analysis**"]
+    if pd.notna(house.get('overall_score')):
+        analysis.append(f"**Overall Score:** {house['overall_score']:.1%}")
+    if house.get('recommendation'):
+        analysis.append(f"**Recommendation:** {house['recommendation']}")
+    
+    breakdown = ["**📊 Score Breakdown**"]
+    for field in CARD_SCORE_FIELDS:
+        if pd.notna(house.get(field)):
+            breakdown.append(f"{field.replace('_score', '').title()}: {house[field]:.2f}")
+    
+    return "  \n".join(details), "  \n".join(analysis), "  \n".join(breakdown)
+
+def csv_gz_bytes(df, chunk_rows=10_000):
+    """Gzip-compressed CSV export, encoded chunk_rows at a time into a bytes buffer"""
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode='wb', compresslevel=1) as gz:
+        text = io.TextIOWrapper(gz, encoding='utf-8', newline='')
+        for start in range(0, max(len(df), 1), chunk_rows):
+            df.iloc[start:start + chunk_rows].to_csv(text, index=False, header=(start == 0))
+        text.flush()
+        text.detach()
+    return buf.getvalue()
+
+@st.cache_resource
+def chart_template():
+    """Register the shared chart defaults once and return the template name to use"""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    
+    pio.templates['house'] = go.layout.Template(layout=dict(
+        height=400,
+        font=dict(size=12),
+        margin=dict(l=40, r=20, t=60, b=40)
+    ))
+    return 'plotly+house'
+
+def _binned_histogram(series, bins, title, color):
+    """Histogram binned server-side so only the bar heights reach the browser"""
+    import plotly.graph_objects as go
+    
+    values = series.to_numpy(dtype='float64', na_value=np.nan)
+    counts, edges = np.histogram(values[~np.isnan(values)], bins=bins)
+    
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color=color
+    ))
+    fig.update_layout(template=chart_template(), title=title, xaxis_title=series.name, yaxis_title="count")
+    return fig
+
+@st.cache_resource
+def build_distribution_charts(fingerprint, _houses_df):
+    """Price and AI score histograms, built once per database fingerprint"""
+    
+    fig_price = _binned_histogram(_houses_df['price'], 25, "💰 Price Distribution of Active Houses", '#1f77b4')
+    
+    fig_scores = None
+    if 'overall_score' in _houses_df.columns:
+        fig_scores = _binned_histogram(_houses_df['overall_score'], 20, "🎯 AI Score Distribution", '#ff7f0e')
+    
+    return fig_price, fig_scores
+
+@st.cache_resource
+def build_neighborhood_chart(top_neighborhoods):
+    """Horizontal bar of the top neighborhoods by house count"""
+    import plotly.express as px
+    
+    neighborhoods = [n[0] for n in top_neighborhoods]
+    counts = [n[1] for n in top_neighborhoods]
+    
+    fig_neighborhoods = px.bar(
+        x=counts,
+        y=neighborhoods,
+        orientation='h',
+        title="Houses by Neighborhood",
+        color_discrete_sequence=['#2ca02c'],
+        template=chart_template(),
+        height=300
+    )
+    return fig_neighborhoods
+
+@st.cache_resource
+def build_efficiency_chart(fingerprint, _activity_df):
+    """Houses-per-call trend line for the dashboard"""
+    import plotly.graph_objects as go
+    
+    fig_efficiency = go.Figure()
+    
+    fig_efficiency.add_trace(go.Scatter(
+        x=_activity_df['date'],
+        y=_activity_df['efficiency_ratio'],
+        mode='lines+markers',
+        name='Houses per API Call',
+        line=dict(color='green', width=3),
+        marker=dict(size=8)
+    ))
+    
+    fig_efficiency.update_layout(
+        template=chart_template(),
+        title="Collection Efficiency Over Time",
+        xaxis_title="Date",
+        yaxis_title="Houses per API Call",
+        height=300,
+        showlegend=False
+    )
+    return fig_efficiency
+
+@st.cache_resource
+def build_activity_chart(fingerprint, _activity_df):
+    """Daily calls/houses bars with the efficiency line on a second axis"""
+    import plotly.graph_objects as go
+    
+    fig_activity = go.Figure()
+    
+    fig_activity.add_trace(go.Bar(
+        x=_activity_df['date'],
+        y=_activity_df['api_calls_made'],
+        name='API Calls',
+        marker_color='lightcoral',
+        yaxis='y'
+    ))
+    
+    fig_activity.add_trace(go.Bar(
+        x=_activity_df['date'],
+        y=_activity_df['houses_collected'],
+        name='Houses Collected',
+        marker_color='lightblue',
+        yaxis='y'
+    ))
+    
+    fig_activity.add_trace(go.Scatter(
+        x=_activity_df['date'],
+        y=_activity_df['efficiency_ratio'],
+        mode='lines+markers',
+        name='Efficiency (houses/call)',
+        line=dict(color='green', width=3),
+        yaxis='y2'
+    ))
+    
+    fig_activity.update_layout(
+        template=chart_template(),
+        title="Collection Activity Over Time",
+        xaxis_title="Date",
+        yaxis=dict(title="Count", side="left"),
+        yaxis2=dict(title="Efficiency", side="right", overlaying="y"),
+        barmode='group',
+        height=500
+    )
+    return fig_activity
+
 def main():
     st.title("🏠 Comprehensive Data Collection Manager")
     st.markdown("*Enhanced efficiency manager for comprehensive_data_collector.py*")
@@ -118,993 +550,455 @@ def main():
     # Initialize collector
     collector = get_collector()
     
+    # Load data and stats once per run; every tab renders from these
+    houses_df, activity_df, meta = load_database_data()
+    db_stats = get_database_stats(houses_df)
+    
     # Sidebar with controls and status
     with st.sidebar:
-        st.header("🎛️ Collection Controls")
-        
-        # Get current stats
-        db_stats = get_database_stats()
-        
-        # Current status
-        st.subheader("📊 Current Status")
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.metric("Active Houses", db_stats.get('active_houses', 0))
-            st.metric("API Calls Today", db_stats.get('today_calls', 0))
-        
-        with col2:
-            st.metric("Houses Today", db_stats.get('today_houses', 0))
-            if db_stats.get('today_efficiency', 0) > 0:
-                st.metric("Efficiency", f"{db_stats['today_efficiency']:.1f}/call")
-            else:
-                st.metric("Efficiency", "N/A")
-        
-        # Monthly budget simulation
-        st.subheader("📈 Monthly Budget")
-        monthly_calls_used = db_stats.get('today_calls', 0)  # Simplified for demo
-        monthly_budget = 100
-        remaining_calls = monthly_budget - monthly_calls_used
-        
-        progress = min(monthly_calls_used / monthly_budget, 1.0)
-        st.progress(progress)
-        st.write(f"**{monthly_calls_used}/{monthly_budget} calls used**")
-        st.write(f"**{remaining_calls} calls remaining**")
-        
-        # Collection settings
-        st.subheader("⚙️ Session Settings")
-        
-        max_calls = st.slider("Max API Calls This Session", 1, 15, 5)
-        
-        collection_strategy = st.selectbox(
-            "Collection Strategy",
-            ["Balanced (Collect + Validate)", "Collection Heavy", "Validation Heavy"]
-        )
-        
-        st.info(f"**Expected Result:**\n{max_calls * 25}-{max_calls * 35} houses")
-        
-        # Main action buttons
-        st.subheader("🚀 Actions")
-        
-        if st.button("🔄 Run Full Collection", type="primary", help="Run comprehensive collection with validation"):
-            with st.spinner("Running comprehensive data collection..."):
-                # Update collector settings
-                collector.max_calls = max_calls
-                
-                # Run collection
-                results = collector.run_comprehensive_collection()
-                
-                st.success("✅ Collection Complete!")
-                
-                # Show results
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("API Calls Used", results['api_calls_used'])
-                    st.metric("Houses Collected", results['houses_collected'])
-                
-                with col2:
-                    st.metric("Houses Validated", results['houses_validated'])
-                    st.metric("Efficiency", f"{results['efficiency']:.1f}/call")
-                
-                st.info(f"📁 Data exported to: {results['csv_file']}")
-                st.rerun()
-        
-        if st.button("✅ Validate Only", help="Only validate existing listings"):
-            with st.spinner("Validating existing listings..."):
-                results = collector.validate_existing_listings(max_calls)
-                
-                st.success("✅ Validation Complete!")
-                st.json(results)
-                st.rerun()
-        
-        if st.button("📊 Show Collector Status"):
-            collector.show_current_status()
-        
-        if st.button("📁 Export Current Data"):
-            csv_file = collector.export_comprehensive_data()
-            st.success(f"✅ Exported to: {csv_file}")
+        _sidebar_controls(collector, db_stats)
     
-    # Main content tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["📊 Dashboard", "🏠 House Browser", "📈 Collection Analytics", "⚙️ Management"])
+    # Main views; only the selected one executes (st.tabs would run all four),
+    # and the widget-bearing ones are fragments so their widgets only rerun that view
+    view = st.radio("View", TAB_LABELS, horizontal=True, key="active_view", label_visibility="collapsed")
     
-    with tab1:
-        st.header("📊 Collection Dashboard")
-        
-        # Load current data
-        houses_df, activity_df = load_database_data()
-        db_stats = get_database_stats()
-        
-        # Key metrics row
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric(
-                "Total Active Houses", 
-                db_stats.get('active_houses', 0),
-                delta=db_stats.get('recent_houses', 0)
-            )
-        
-        with col2:
-            avg_price = db_stats.get('price_avg', 0)
-            if avg_price > 0:
-                st.metric("Average Price", f"${avg_price:,.0f}")
-            else:
-                st.metric("Average Price", "No data")
-        
-        with col3:
-            if len(houses_df) > 0 and 'overall_score' in houses_df.columns:
-                avg_score = houses_df['overall_score'].mean()
-                st.metric("Average AI Score", f"{avg_score:.1%}")
-            else:
-                st.metric("Average AI Score", "No scores")
-        
-        with col4:
-            if db_stats.get('today_efficiency', 0) > 0:
-                st.metric("Today's Efficiency", f"{db_stats['today_efficiency']:.1f} houses/call")
-            else:
-                st.metric("Today's Efficiency", "No calls today")
-        
-        # Charts row
-        if len(houses_df) > 0:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Price distribution
-                fig_price = px.histogram(
-                    houses_df, 
-                    x='price', 
-                    title="💰 Price Distribution of Active Houses",
-                    nbins=25,
-                    color_discrete_sequence=['#1f77b4']
-                )
-                fig_price.update_layout(height=400)
-                st.plotly_chart(fig_price, use_container_width=True)
-            
-            with col2:
-                # Score distribution
-                if 'overall_score' in houses_df.columns:
-                    fig_scores = px.histogram(
-                        houses_df,
-                        x='overall_score',
-                        title="🎯 AI Score Distribution",
-                        nbins=20,
-                        color_discrete_sequence=['#ff7f0e']
-                    )
-                    fig_scores.update_layout(height=400)
-                    st.plotly_chart(fig_scores, use_container_width=True)
-        
-        # Top neighborhoods
-        if db_stats.get('top_neighborhoods'):
-            st.subheader("🏘️ Top Neighborhoods by House Count")
-            
-            neighborhoods = [n[0] for n in db_stats['top_neighborhoods']]
-            counts = [n[1] for n in db_stats['top_neighborhoods']]
-            
-            fig_neighborhoods = px.bar(
-                x=counts,
-                y=neighborhoods,
-                orientation='h',
-                title="Houses by Neighborhood",
-                color_discrete_sequence=['#2ca02c']
-            )
-            fig_neighborhoods.update_layout(height=300)
-            st.plotly_chart(fig_neighborhoods, use_container_width=True)
-        
-        # Collection efficiency over time
-        if len(activity_df) > 1:
-            st.subheader("📈 Collection Efficiency Trend")
-            
-            activity_df['date'] = pd.to_datetime(activity_df['date'])
-            
-            fig_efficiency = go.Figure()
-            
-            fig_efficiency.add_trace(go.Scatter(
-                x=activity_df['date'],
-                y=activity_df['efficiency_ratio'],
-                mode='lines+markers',
-                name='Houses per API Call',
-                line=dict(color='green', width=3),
-                marker=dict(size=8)
-            ))
-            
-            fig_efficiency.update_layout(
-                title="Collection Efficiency Over Time",
-                xaxis_title="Date",
-                yaxis_title="Houses per API Call",
-                height=300,
-                showlegend=False
-            )
-            
-            st.plotly_chart(fig_efficiency, use_container_width=True)
+    if view == TAB_LABELS[0]:
+        dashboard_tab(houses_df, activity_df, db_stats, meta)
+    elif view == TAB_LABELS[1]:
+        house_browser_tab(meta)
+    elif view == TAB_LABELS[2]:
+        analytics_tab(activity_df, meta)
+    else:
+        management_tab(collector, houses_df, activity_df, db_stats)
+
+@st.fragment
+def _sidebar_controls(collector, db_stats):
+    """Sidebar status, budget and collection actions"""
+    st.header("🎛️ Collection Controls")
     
-    with tab2:
-        st.header("🏠 House Browser")
-        
-        houses_df, _ = load_database_data()
-        
-        if len(houses_df) > 0:
-            # Filters
-            st.subheader("🔍 Filters")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                if 'price' in houses_df.columns:
-                    price_range = st.slider(
-                        "Price Range",
-                        min_value=int(houses_df['price'].min()),
-                        max_value=int(houses_df['price'].max()),
-                        value=(int(houses_df['price'].min()), int(houses_df['price'].max())),
-                        format="$%d"
-                    )
-                else:
-                    price_range = (0, 1000000)
-            
-            with col2:
-                if 'neighborhood' in houses_df.columns:
-                    neighborhoods = sorted(houses_df['neighborhood'].unique())
-                    selected_neighborhoods = st.multiselect(
-                        "Neighborhoods",
-                        neighborhoods,
-                        default=neighborhoods[:10]  # Limit default selection
-                    )
-                else:
-                    selected_neighborhoods = []
-            
-            with col3:
-                if 'bedrooms' in houses_df.columns:
-                    min_beds = st.selectbox("Min Bedrooms", [1, 2, 3, 4, 5], index=0)
-                else:
-                    min_beds = 1
-            
-            with col4:
-                if 'overall_score' in houses_df.columns:
-                    min_score = st.slider("Min AI Score", 0.0, 1.0, 0.0, 0.05, format="%.0%%")
-                else:
-                    min_score = 0.0
-            
-            # Apply filters
-            filtered_df = houses_df.copy()
-            
-            if 'price' in filtered_df.columns:
-                filtered_df = filtered_df[
-                    (filtered_df['price'] >= price_range[0]) &
-                    (filtered_df['price'] <= price_range[1])
-                ]
-            
-            if 'bedrooms' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['bedrooms'] >= min_beds]
-            
-            if selected_neighborhoods and 'neighborhood' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['neighborhood'].isin(selected_neighborhoods)]
-            
-            if 'overall_score' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['overall_score'] >= min_score]
+    # Current status
+    st.subheader("📊 Current Status")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.metric("Active Houses", db_stats.get('active_houses', 0))
+        st.metric("API Calls Today", db_stats.get('today_calls', 0))
+    
+    with col2:
+        st.metric("Houses Today", db_stats.get('today_houses', 0))
+        if db_stats.get('today_efficiency', 0) > 0:
+            st.metric("Efficiency", f"{db_stats['today_efficiency']:.1f}/call")
+        else:
+            st.metric("Efficiency", "N/A")
+    
+    # Monthly budget simulation
+    st.subheader("📈 Monthly Budget")
+    monthly_calls_used = db_stats.get('today_calls', 0)  # Simplified for demo
+    monthly_budget = 100
+    remaining_calls = monthly_budget - monthly_calls_used
+    
+    progress = min(monthly_calls_used / monthly_budget, 1.0)
+    st.progress(progress)
+    st.write(f"**{monthly_calls_used}/{monthly_budget} calls used**")
+    st.write(f"**{remaining_calls} calls remaining**")
+    
+    # Collection settings
+    st.subheader("⚙️ Session Settings")
+    
+    max_calls = st.slider("Max API Calls This Session", 1, 15, 5)
+    
+    collection_strategy = st.selectbox(
+        "Collection Strategy",
+        COLLECTION_STRATEGIES
+    )
+    
+    st.info(f"**Expected Result:**\n{max_calls * 25}-{max_calls * 35} houses")
+    
+    # Main action buttons
+    st.subheader("🚀 Actions")
+    
+    if st.button("🔄 Run Full Collection", type="primary", help="Run comprehensive collection with validation"):
+        with st.spinner("Running comprehensive data collection..."):
+            # Update collector settings
+            collector.max_calls = max_calls
             
-            st.write(f"**Showing {len(filtered_df)} houses** (filtered from {len(houses_df)} total)")
+            # Run collection
+            results = collector.run_comprehensive_collection()
             
-            # Display options
-            col1, col2 = st.columns([3, 1])
+            st.success("✅ Collection Complete!")
             
+            # Show results
+            col1, col2 = st.columns(2)
             with col1:
-                view_mode = st.radio("View Mode", ["Table", "Cards"], horizontal=True)
+                st.metric("API Calls Used", results['api_calls_used'])
+                st.metric("Houses Collected", results['houses_collected'])
             
             with col2:
-                sort_by = st.selectbox("Sort By", 
-                    ["Overall Score", "Price", "Last Updated", "Bedrooms", "Square Feet"])
-            
-            # Sort data
-            sort_mapping = {
-                "Overall Score": "overall_score",
-                "Price": "price", 
-                "Last Updated": "last_updated",
-                "Bedrooms": "bedrooms",
-                "Square Feet": "sqft"
-            }
-            
-            sort_col = sort_mapping.get(sort_by, "overall_score")
-            if sort_col in filtered_df.columns:
-                filtered_df = filtered_df.sort_values(sort_col, ascending=False)
-            
-            # Display data
-            if view_mode == "Table":
-                # Table view
-                display_columns = [
-                    'address', 'price', 'bedrooms', 'bathrooms', 'sqft', 
-                    'neighborhood', 'overall_score', 'recommendation', 'last_updated'
-                ]
-                
-                available_columns = [col for col in display_columns if col in filtered_df.columns]
-                display_df = filtered_df[available_columns].copy()
-                
-                # Format columns
-                if 'price' in display_df.columns:
-                    display_df['price'] = display_df['price'].apply(lambda x: f"${x:,.0f}")
-                if 'overall_score' in display_df.columns:
-                    display_df['overall_score'] = display_df['overall_score'].apply(lambda x: f"{x:.1%}")
-                if 'last_updated' in display_df.columns:
-                    display_df['last_updated'] = pd.to_datetime(display_df['last_updated']).dt.strftime('%m/%d/%Y')
-                
-                st.dataframe(
-                    display_df,
-                    use_container_width=True,
-                    height=600
-                )
+                st.metric("Houses Validated", results['houses_validated'])
+                st.metric("Efficiency", f"{results['efficiency']:.1f}/call")
             
-            else:
-                # Card view - show top 10
-                st.subheader("🏆 Top Houses (Card View)")
-                
-                for idx, (_, house) in enumerate(filtered_df.head(10).iterrows()):
-                    with st.expander(
-                        f"#{idx+1} - {house.get('address', 'No address')} - "
-                        f"${house.get('price', 0):,.0f} - "
-                        f"Score: {house.get('overall_score', 0):.1%}",
-                        expanded=(idx < 3)
-                    ):
-                        col1, col2, col3 = st.columns([2, 1, 1])
-                        
-                        with col1:
-                            st.write("**🏠 Property Details**")
-                            st.write(f"📍 **Address:** {house.get('address', 'N/A')}")
-                            st.write(f"💰 **Price:** ${house.get('price', 0):,.0f}")
-                            st.write(f"🏠 **Layout:** {house.get('bedrooms', 0)} bed, {house.get('bathrooms', 0)} bath")
-                            st.write(f"📐 **Size:** {house.get('sqft', 0):,} sqft")
-                            st.write(f"📅 **Built:** {house.get('year_built', 'N/A')}")
-                            st.write(f"🏘️ **Area:** {house.get('neighborhood', 'N/A')}")
-                            
-                            if house.get('listing_url'):
-                                st.markdown(f"🔗 **[View on Zillow]({house['listing_url']})**")
-                        
-                        with col2:
-                            st.write("**🎯 AI Analysis**")
-                            if house.get('overall_score'):
-                                st.metric("Overall Score", f"{house['overall_score']:.1%}")
-                            
-                            if house.get('recommendation'):
-                                st.write(f"**Recommendation:**")
-                                st.write(house['recommendation'])
-                        
-                        with col3:
-                            st.write("**📊 Score Breakdown**")
-                            score_fields = ['price_score', 'commute_score', 'size_score', 'age_score', 'location_score']
-                            
-                            for field in score_fields:
-                                if house.get(field) is not None:
-                                    field_name = field.replace('_score', '').title()
-                                    st.write(f"{field_name}: {house[field]:.2f}")
+            st.info(f"📁 Data exported to: {results['csv_file']}")
+            st.rerun()
+    
+    if st.button("✅ Validate Only", help="Only validate existing listings"):
+        with st.spinner("Validating existing listings..."):
+            results = collector.validate_existing_listings(max_calls)
             
-            # Download filtered data
-            if len(filtered_df) > 0:
-                csv_data = filtered_df.to_csv(index=False)
-                st.download_button(
-                    "📥 Download Filtered Data",
-                    csv_data,
-                    file_name=f"filtered_houses_{datetime.now().strftime('%Y%m%d_%H%M')}.csv",
-                    mime="text/csv"
-                )
-        
+            st.success("✅ Validation Complete!")
+            st.json(results)
+            st.rerun()
+    
+    if st.button("📊 Show Collector Status"):
+        collector.show_current_status()
+    
+    if st.button("📁 Export Current Data"):
+        csv_file = collector.export_comprehensive_data()
+        st.success(f"✅ Exported to: {csv_file}")
+    
+    if st.button("🔄 Refresh Stats", help="Drop cached stats and reload from the database"):
+        st.cache_data.clear()
+        st.rerun()
+
+def dashboard_tab(houses_df, activity_df, db_stats, meta):
+    """Key metrics and overview charts"""
+    st.header("📊 Collection Dashboard")
+    
+    # Key metrics row
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric(
+            "Total Active Houses", 
+            db_stats.get('active_houses', 0),
+            delta=db_stats.get('recent_houses', 0)
+        )
+    
+    with col2:
+        avg_price = db_stats.get('price_avg', 0)
+        if avg_price > 0:
+            st.metric("Average Price", f"${avg_price:,.0f}")
         else:
-            st.info("📭 No house data available. Run data collection to populate the database.")
-            if st.button("🚀 Start Data Collection"):
-                st.rerun()
+            st.metric("Average Price", "No data")
     
-    with tab3:
-        st.header("📈 Collection Analytics")
-        
-        _, activity_df = load_database_data()
-        
-        if len(activity_df) > 0:
-            # Summary metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            total_calls = activity_df['api_calls_made'].sum()
-            total_houses = activity_df['houses_collected'].sum()
-            total_validated = activity_df['houses_validated'].sum()
-            avg_efficiency = activity_df['efficiency_ratio'].mean()
-            
-            with col1:
-                st.metric("Total API Calls", total_calls)
-            
-            with col2:
-                st.metric("Total Houses Collected", total_houses)
-            
-            with col3:
-                st.metric("Houses Validated", total_validated)
-            
-            with col4:
-                st.metric("Average Efficiency", f"{avg_efficiency:.1f} houses/call")
-            
-            # Activity charts
-            activity_df['date'] = pd.to_datetime(activity_df['date'])
-            
-            # Daily activity chart
-            fig_activity = go.Figure()
-            
-            fig_activity.add_trace(go.Bar(
-                x=activity_df['date'],
-                y=activity_df['api_calls_made'],
-                name='API Calls',
-                marker_color='lightcoral',
-                yaxis='y'
-            ))
-            
-            fig_activity.add_trace(go.Bar(
-                x=activity_df['date'],
-                y=activity_df['houses_collected'],
-                name='Houses Collected',
-                marker_color='lightblue',
-                yaxis='y'
-            ))
-            
-            fig_activity.add_trace(go.Scatter(
-                x=activity_df['date'],
-                y=activity_df['efficiency_ratio'],
-                mode='lines+markers',
-                name='Efficiency (houses/call)',
-                line=dict(color='green', width=3),
-                yaxis='y2'
-            ))
-            
-            fig_activity.update_layout(
-                title="Collection Activity Over Time",
-                xaxis_title="Date",
-                yaxis=dict(title="Count", side="left"),
-                yaxis2=dict(title="Efficiency", side="right", overlaying="y"),
-                barmode='group',
-                height=500
-            )
-            
-            st.plotly_chart(fig_activity, use_container_width=True)
-            
-            # Performance analysis
-            if len(activity_df) > 1:
-                st.subheader("🎯 Performance Analysis")
-                
-                best_day = activity_df.loc[activity_df['efficiency_ratio'].idxmax()]
-                recent_avg = activity_df.head(7)['efficiency_ratio'].mean()
-                
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    st.success("**Best Performance Day**")
-                    st.write(f"📅 Date: {best_day['date'].strftime('%m/%d/%Y')}")
-                    st.write(f"🎯 Efficiency: {best_day['efficiency_ratio']:.1f} houses/call")
-                    st.write(f"🏠 Houses: {best_day['houses_collected']}")
-                    st.write(f"📞 API Calls: {best_day['api_calls_made']}")
-                
-                with col2:
-                    st.info("**Recent Performance (7 days)**")
-                    st.write(f"📈 Avg Efficiency: {recent_avg:.1f} houses/call")
-                    recent_calls = activity_df.head(7)['api_calls_made'].sum()
-                    recent_houses = activity_df.head(7)['houses_collected'].sum()
-                    st.write(f"📞 Total Calls: {recent_calls}")
-                    st.write(f"🏠 Total Houses: {recent_houses}")
-                
-                with col3:
-                    # Trend analysis
-                    if len(activity_df) >= 5:
-                        recent_5 = activity_df.head(5)['efficiency_ratio'].mean()
-                        older_5 = activity_df.tail(5)['efficiency_ratio'].mean()
-                        trend = "📈 Improving" if recent_5 > older_5 else "📉 Declining" if recent_5 < older_5 else "➡️ Stable"
-                        
-                        st.warning("**Trend Analysis**")
-                        st.write(f"📊 Trend: {trend}")
-                        st.write(f"🔄 Recent 5 days: {recent_5:.1f}")
-                        st.write(f"📜 Previous 5 days: {older_5:.1f}")
-        
+    with col3:
+        if len(houses_df) > 0 and 'overall_score' in houses_df.columns:
+            avg_score = houses_df['overall_score'].mean()
+            st.metric("Average AI Score", f"{avg_score:.1%}")
         else:
-            st.info("📈 No analytics data available. Start collecting data to see performance metrics.")
+            st.metric("Average AI Score", "No scores")
     
-    with tab4:
-        st.header("⚙️ Management Tools")
-        
-        # Database information
-        st.subheader("🗄️ Database Information")
-        
-        db_stats = get_database_stats()
-        
+    with col4:
+        if db_stats.get('today_efficiency', 0) > 0:
+            st.metric("Today's Efficiency", f"{db_stats['today_efficiency']:.1f} houses/call")
+        else:
+            st.metric("Today's Efficiency", "No calls today")
+    
+    # Charts row (figures are cached until the database file changes)
+    if len(houses_df) > 0:
+        fig_price, fig_scores = build_distribution_charts(meta['fingerprint'], houses_df)
         col1, col2 = st.columns(2)
         
         with col1:
-            st.info("**Database Statistics**")
-            st.write(f"📊 Total houses: {db_stats.get('total_houses', 0)}")
-            st.write(f"✅ Active houses: {db_stats.get('active_houses', 0)}")
-            st.write(f"🆕 Recent houses (7 days): {db_stats.get('recent_houses', 0)}")
-            st.write(f"💰 Price range: ${db_stats.get('price_min', 0):,.0f} - ${db_stats.get('price_max', 0):,.0f}")
+            # Price distribution
+            st.plotly_chart(fig_price, use_container_width=True)
         
         with col2:
-            st.success("**Collection Status**")
-            st.write(f"📞 API calls today: {db_stats.get('today_calls', 0)}")
-            st.write(f"🏠 Houses today: {db_stats.get('today_houses', 0)}")
-            st.write(f"⚡ Today's efficiency: {db_stats.get('today_efficiency', 0):.1f} houses/call")
-            
-            # Database file info
-            try:
-                import os
-                db_size = os.path.getsize(get_collector().db_path) / 1024 / 1024  # MB
-                st.write(f"💾 Database size: {db_size:.1f} MB")
-            except:
-                st.write("💾 Database size: Unknown")
-        
-        # Manual operations
-        st.subheader("🔧 Manual Operations")
-        
-        col1, col2, col3 = st.columns(3)
+            # Score distribution
+            if fig_scores is not None:
+                st.plotly_chart(fig_scores, use_container_width=True)
+    
+    # Top neighborhoods
+    if db_stats.get('top_neighborhoods'):
+        st.subheader("🏘️ Top Neighborhoods by House Count")
+        st.plotly_chart(build_neighborhood_chart(db_stats['top_neighborhoods']), use_container_width=True)
+    
+    # Collection efficiency over time
+    if len(activity_df) > 1:
+        st.subheader("📈 Collection Efficiency Trend")
+        st.plotly_chart(build_efficiency_chart(meta['fingerprint'], activity_df), use_container_width=True)
+
+@st.fragment
+def house_browser_tab(meta):
+    """Filterable, paged view of active houses
+    
+    Takes only the small per-load meta dict; rows come from SQL per page.
+    """
+    st.header("🏠 House Browser")
+    
+    if meta['rows'] > 0:
+        # Filters
+        st.subheader("🔍 Filters")
+        col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            if st.button("🧹 Clean Database", help="Remove inactive listings older than 30 days"):
-                # Placeholder for cleanup operation
-                st.info("Database cleanup would remove old inactive listings")
+            if 'price' in meta['columns']:
+                price_range = st.slider(
+                    "Price Range",
+                    min_value=meta['price_min'],
+                    max_value=meta['price_max'],
+                    value=(meta['price_min'], meta['price_max']),
+                    format="$%d"
+                )
+            else:
+                price_range = (0, 1000000)
         
         with col2:
-            if st.button("🔄 Refresh All Scores", help="Recalculate AI scores for all houses"):
-                st.info("This would recalculate all AI scores using current parameters")
+            if 'neighborhood' in meta['columns']:
+                neighborhoods = meta['neighborhoods']
+                selected_neighborhoods = st.multiselect(
+                    "Neighborhoods",
+                    neighborhoods,
+                    default=neighborhoods[:10]  # Limit default selection
+                )
+            else:
+                selected_neighborhoods = []
         
         with col3:
-            if st.button("📊 Database Statistics", help="Show detailed database statistics"):
-                houses_df, activity_df = load_database_data()
-                
-                if len(houses_df) > 0:
-                    st.write("**Detailed Statistics:**")
-                    st.write(f"Houses with scores: {len(houses_df[houses_df['overall_score'].notna()])}")
-                    st.write(f"Average score: {houses_df['overall_score'].mean():.1%}")
-                    st.write(f"Neighborhoods: {houses_df['neighborhood'].nunique()}")
-                    st.write(f"Price per sqft avg: ${(houses_df['price'] / houses_df['sqft']).mean():.0f}")
+            if 'bedrooms' in meta['columns']:
+                min_beds = st.selectbox("Min Bedrooms", [1, 2, 3, 4, 5], index=0)
+            else:
+                min_beds = 1
         
-        # Export options
-        st.subheader("📁 Export Options")
+        with col4:
+            if 'overall_score' in meta['columns']:
+                min_score = st.slider("Min AI Score", 0.0, 1.0, 0.0, 0.05, format="%.0%%")
+            else:
+                min_score = 0.0
         
-        col1, col2 = st.columns(2)
+        # Display options
+        col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
         
         with col1:
-            if st.button("📥 Export All Active Houses"):
-                try:
-                    csv_file = collector.export_comprehensive_data()
-                    st.success(f"✅ Exported to: {csv_file}")
-                except Exception as e:
-                    st.error(f"Export failed: {e}")
+            view_mode = st.radio("View Mode", ["Table", "Cards"], horizontal=True)
         
         with col2:
-            if st.button("📊 Export Collection Log"):
-                try:
-                    _, activity_df = load_database_data()
-                    csv_data = activity_df.to_csv(index=False)
-                    st.download_button(
-                        "📥 Download Collection Log",
-                        csv_data,
-                        file_name=f"collection_log_{datetime.now().strftime('%Y%m%d')}.csv",
-                        mime="text/csv"
-                    )
-                except Exception as e:
-                    st.error(f"Export failed: {e}")
-
-
-if __name__ == "__main__":
-    main()
-
-st.set_page_config(
-    page_title="Zillow Data Collection Manager",
-    page_icon="🏠",
-    layout="wide"
-)
-
-@st.cache_resource
-def get_collector():
-    """Get collector instance"""
-    return EfficientZillowCollector()
-
-def load_database_data():
-    """Load data from SQLite database"""
-    
-    try:
-        collector = get_collector()
-        conn = sqlite3.connect(collector.db_path)
-        
-        # Load houses
-        houses_df = pd.read_sql_query('''
-            SELECT * FROM houses 
-            WHERE is_active = 1 
-            ORDER BY last_updated DESC
-        ''', conn)
+            sort_by = st.selectbox("Sort By", list(SORT_COLUMNS))
         
-        # Load API usage
-        usage_df = pd.read_sql_query('''
-            SELECT * FROM api_usage 
-            ORDER BY date DESC
-            LIMIT 30
-        ''', conn)
-        
-        conn.close()
-        
-        return houses_df, usage_df
-        
-    except Exception as e:
-        st.error(f"Error loading database: {e}")
-        return pd.DataFrame(), pd.DataFrame()
-
-def main():
-    st.title("🏠 Efficient Zillow Data Collection Manager")
-    st.markdown("*Maximize data collection while minimizing API calls*")
-    
-    # Initialize collector
-    collector = get_collector()
-    
-    # Sidebar with controls
-    with st.sidebar:
-        st.header("🎛️ Collection Controls")
-        
-        # API usage tracking
-        usage_today = collector.get_api_usage_today()
-        st.metric("API Calls Today", usage_today['calls_made'])
-        st.metric("Houses Collected Today", usage_today['houses_collected'])
-        
-        if usage_today['calls_made'] > 0:
-            efficiency = usage_today['houses_collected'] / usage_today['calls_made']
-            st.metric("Efficiency", f"{efficiency:.1f} houses/call")
+        with col3:
+            page_size = st.selectbox("Rows per Page", [25, 50, 100], index=1)
         
-        # Monthly budget tracking
-        st.markdown("### 📊 Monthly Budget")
-        monthly_calls = usage_today['calls_made']  # Simplified for demo
-        remaining_calls = 100 - monthly_calls
+        sort_col = SORT_COLUMNS[sort_by]
         
-        progress = monthly_calls / 100
-        st.progress(progress)
-        st.write(f"Used: {monthly_calls}/100 calls ({remaining_calls} remaining)")
+        # Filters, sort and paging run in SQLite; only the page enters pandas
+        filter_args = (price_range, min_beds, selected_neighborhoods, min_score)
+        total_matches = count_houses(*filter_args)
+        page_count = max((total_matches + page_size - 1) // page_size, 1)
         
-        # Collection settings
-        st.markdown("### ⚙️ Collection Settings")
+        with col4:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1)
         
-        max_calls = st.slider("Max Calls This Session", 1, 10, 5)
+        filtered_df = query_houses(*filter_args, sort_col, limit=page_size, offset=(page - 1) * page_size)
         
-        collection_mode = st.selectbox(
-            "Collection Mode",
-            ["Balanced", "Validation Heavy", "Collection Heavy"]
-        )
+        st.write(f"**Showing {len(filtered_df)} of {total_matches} matching houses** (from {meta['rows']} total)")
         
-        # Action buttons
-        st.markdown("### 🚀 Actions")
+        # Display data
+        if view_mode == "Table":
+            # Table view
+            # Build the display frame from the existing columns; only the scaled
+            # score is a new allocation (last_updated is already a datetime)
+            display_df = pd.DataFrame({
+                col: filtered_df[col] * 100 if col == 'overall_score' else filtered_df[col]
+                for col in TABLE_COLUMNS if col in filtered_df.columns
+            }, copy=False)
+            
+            st.dataframe(
+                display_df,
+                column_config={
+                    'price': st.column_config.NumberColumn("Price", format="$%d"),
+                    'overall_score': st.column_config.NumberColumn("AI Score", format="%.1f%%"),
+                    'last_updated': st.column_config.DateColumn("Last Updated", format="MM/DD/YYYY")
+                },
+                use_container_width=True,
+                height=600
+            )
         
-        if st.button("🔄 Run Data Collection", type="primary"):
-            with st.spinner("Running efficient data collection..."):
-                collector.max_calls_per_session = max_calls
-                results = collector.run_efficient_collection()
+        else:
+            # Card view - show top 10
+            st.subheader("🏆 Top Houses (Card View)")
+            
+            for idx, house in enumerate(filtered_df.head(10).to_dict('records')):
+                details_md, analysis_md, breakdown_md = _card_markdown(house)
                 
-                st.success("Collection complete!")
-                st.json(results)
-                st.rerun()
-        
-        if st.button("✅ Validate Listings Only"):
-            with st.spinner("Validating existing listings..."):
-                results = collector.validate_existing_listings(max_calls)
-                st.success("Validation complete!")
-                st.json(results)
-                st.rerun()
-        
-        if st.button("📊 Database Stats"):
-            stats = collector.get_current_database_stats()
-            st.json(stats)
-        
-        if st.button("📁 Export CSV"):
-            csv_file = collector.export_to_csv()
-            st.success(f"Exported to {csv_file}")
+                with st.expander(
+                    f"#{idx+1} - {house.get('address', 'No address')} - "
+                    f"${house.get('price', 0):,.0f} - "
+                    f"Score: {house.get('overall_score', 0):.1%}",
+                    expanded=(idx < 3)
+                ):
+                    col1, col2, col3 = st.columns([2, 1, 1])
+                    col1.markdown(details_md)
+                    col2.markdown(analysis_md)
+                    col3.markdown(breakdown_md)
+        
+        # Download filtered data (all matches, fetched only on request)
+        if total_matches > 0 and st.button("📁 Prepare Filtered Export"):
+            export_df = query_houses(*filter_args, sort_col, limit=None, columns='*')
+            st.download_button(
+                "📥 Download Filtered Data",
+                csv_gz_bytes(export_df),
+                file_name=f"filtered_houses_{datetime.now().strftime('%Y%m%d_%H%M')}.csv.gz",
+                mime="application/gzip"
+            )
     
-    # Main content area
-    tab1, tab2, tab3, tab4 = st.tabs(["📊 Dashboard", "🏠 House Data", "📈 API Usage", "⚙️ Management"])
+    else:
+        st.info("📭 No house data available. Run data collection to populate the database.")
+        if st.button("🚀 Start Data Collection"):
+            st.rerun()
+
+def analytics_tab(activity_df, meta):
+    """Collection activity and efficiency analytics"""
+    st.header("📈 Collection Analytics")
     
-    with tab1:
-        st.header("📊 Collection Dashboard")
-        
-        # Load current data
-        houses_df, usage_df = load_database_data()
-        db_stats = collector.get_current_database_stats()
-        
-        # Key metrics
+    if len(activity_df) > 0:
+        # Summary metrics
         col1, col2, col3, col4 = st.columns(4)
         
+        total_calls = activity_df['api_calls_made'].sum()
+        total_houses = activity_df['houses_collected'].sum()
+        total_validated = activity_df['houses_validated'].sum()
+        avg_efficiency = activity_df['efficiency_ratio'].mean()
+        
         with col1:
-            st.metric("Total Active Houses", db_stats['active_houses'])
+            st.metric("Total API Calls", total_calls)
         
         with col2:
-            if db_stats['price_avg'] > 0:
-                st.metric("Average Price", f"${db_stats['price_avg']:,.0f}")
-            else:
-                st.metric("Average Price", "N/A")
+            st.metric("Total Houses Collected", total_houses)
         
         with col3:
-            recent_count = len(houses_df[houses_df['last_updated'] > (datetime.now() - timedelta(days=7)).isoformat()])
-            st.metric("New This Week", recent_count)
+            st.metric("Houses Validated", total_validated)
         
         with col4:
-            if usage_today['calls_made'] > 0:
-                efficiency = usage_today['houses_collected'] / usage_today['calls_made']
-                st.metric("Collection Efficiency", f"{efficiency:.1f} houses/call")
-            else:
-                st.metric("Collection Efficiency", "No calls today")
+            st.metric("Average Efficiency", f"{avg_efficiency:.1f} houses/call")
         
-        # Charts
-        if len(houses_df) > 0:
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Price distribution
-                fig_price = px.histogram(
-                    houses_df, 
-                    x='price', 
-                    title="💰 Price Distribution",
-                    nbins=20,
-                    color_discrete_sequence=['#1f77b4']
-                )
-                fig_price.update_layout(height=400)
-                st.plotly_chart(fig_price, use_container_width=True)
-            
-            with col2:
-                # Neighborhood distribution
-                if 'neighborhood' in houses_df.columns:
-                    neighborhood_counts = houses_df['neighborhood'].value_counts().head(10)
-                    fig_neighborhoods = px.bar(
-                        x=neighborhood_counts.values,
-                        y=neighborhood_counts.index,
-                        orientation='h',
-                        title="🏘️ Houses by Neighborhood",
-                        color_discrete_sequence=['#ff7f0e']
-                    )
-                    fig_neighborhoods.update_layout(height=400)
-                    st.plotly_chart(fig_neighborhoods, use_container_width=True)
+        # Activity charts
+        st.plotly_chart(build_activity_chart(meta['fingerprint'], activity_df), use_container_width=True)
         
-        # API usage efficiency chart
-        if len(usage_df) > 0:
-            st.subheader("📈 API Usage Efficiency Over Time")
-            
-            usage_df['date'] = pd.to_datetime(usage_df['date'])
+        # Performance analysis
+        if len(activity_df) > 1:
+            st.subheader("🎯 Performance Analysis")
             
-            fig_efficiency = go.Figure()
+            # Log is oldest-first; reduce plain arrays instead of sliced frames
+            eff = activity_df['efficiency_ratio'].to_numpy(dtype='float64', na_value=np.nan)
+            calls = activity_df['api_calls_made'].to_numpy()
+            houses = activity_df['houses_collected'].to_numpy()
             
-            fig_efficiency.add_trace(go.Scatter(
-                x=usage_df['date'],
-                y=usage_df['efficiency_ratio'],
-                mode='lines+markers',
-                name='Houses per API Call',
-                line=dict(color='green', width=3)
-            ))
+            best_day = activity_df.iloc[np.nanargmax(eff)]
+            recent_avg = np.nanmean(eff[-7:])
             
-            fig_efficiency.update_layout(
-                title="Collection Efficiency Trend",
-                xaxis_title="Date",
-                yaxis_title="Houses per API Call",
-                height=300
-            )
-            
-            st.plotly_chart(fig_efficiency, use_container_width=True)
-    
-    with tab2:
-        st.header("🏠 House Data")
-        
-        houses_df, _ = load_database_data()
-        
-        if len(houses_df) > 0:
-            # Filters
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                price_range = st.slider(
-                    "Price Range",
-                    min_value=int(houses_df['price'].min()),
-                    max_value=int(houses_df['price'].max()),
-                    value=(int(houses_df['price'].min()), int(houses_df['price'].max())),
-                    format="$%d"
-                )
+                st.success("**Best Performance Day**")
+                st.write(f"📅 Date: {best_day['date'].strftime('%m/%d/%Y')}")
+                st.write(f"🎯 Efficiency: {best_day['efficiency_ratio']:.1f} houses/call")
+                st.write(f"🏠 Houses: {best_day['houses_collected']}")
+                st.write(f"📞 API Calls: {best_day['api_calls_made']}")
             
             with col2:
-                neighborhoods = houses_df['neighborhood'].unique() if 'neighborhood' in houses_df.columns else []
-                selected_neighborhoods = st.multiselect(
-                    "Neighborhoods",
-                    neighborhoods,
-                    default=neighborhoods
-                )
+                st.info("**Recent Performance (7 days)**")
+                st.write(f"📈 Avg Efficiency: {recent_avg:.1f} houses/call")
+                recent_calls = calls[-7:].sum()
+                recent_houses = houses[-7:].sum()
+                st.write(f"📞 Total Calls: {recent_calls}")
+                st.write(f"🏠 Total Houses: {recent_houses}")
             
             with col3:
-                min_beds = st.selectbox("Min Bedrooms", [1, 2, 3, 4, 5], index=0)
-            
-            # Apply filters
-            filtered_df = houses_df[
-                (houses_df['price'] >= price_range[0]) &
-                (houses_df['price'] <= price_range[1]) &
-                (houses_df['bedrooms'] >= min_beds)
-            ]
-            
-            if selected_neighborhoods and 'neighborhood' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['neighborhood'].isin(selected_neighborhoods)]
-            
-            st.write(f"Showing {len(filtered_df)} houses")
-            
-            # Display data
-            display_columns = [
-                'address', 'price', 'bedrooms', 'bathrooms', 'sqft', 
-                'neighborhood', 'days_on_market', 'last_updated'
-            ]
-            
-            available_columns = [col for col in display_columns if col in filtered_df.columns]
-            
-            # Format data for display
-            display_df = filtered_df[available_columns].copy()
-            if 'price' in display_df.columns:
-                display_df['price'] = display_df['price'].apply(lambda x: f"${x:,.0f}")
-            if 'last_updated' in display_df.columns:
-                display_df['last_updated'] = pd.to_datetime(display_df['last_updated']).dt.strftime('%m/%d/%Y')
-            
-            st.dataframe(
-                display_df,
-                use_container_width=True,
-                height=500
-            )
-            
-            # Download filtered data
-            csv_data = filtered_df.to_csv(index=False)
-            st.download_button(
-                "📥 Download Filtered Data",
-                csv_data,
-                file_name=f"filtered_houses_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv"
-            )
-        
-        else:
-            st.info("No house data available. Run data collection to populate the database.")
+                # Trend analysis
+                if len(activity_df) >= 5:
+                    recent_5 = np.nanmean(eff[-5:])
+                    older_5 = np.nanmean(eff[:5])
+                    trend = "📈 Improving" if recent_5 > older_5 else "📉 Declining" if recent_5 < older_5 else "➡️ Stable"
+                    
+                    st.warning("**Trend Analysis**")
+                    st.write(f"📊 Trend: {trend}")
+                    st.write(f"🔄 Recent 5 days: {recent_5:.1f}")
+                    st.write(f"📜 Previous 5 days: {older_5:.1f}")
     
-    with tab3:
-        st.header("📈 API Usage Analytics")
-        
-        _, usage_df = load_database_data()
-        
-        if len(usage_df) > 0:
-            # Usage metrics
-            total_calls = usage_df['calls_made'].sum()
-            total_houses = usage_df['houses_collected'].sum()
-            avg_efficiency = usage_df['efficiency_ratio'].mean()
-            
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric("Total API Calls", total_calls)
-            
-            with col2:
-                st.metric("Total Houses Collected", total_houses)
-            
-            with col3:
-                st.metric("Average Efficiency", f"{avg_efficiency:.1f} houses/call")
-            
-            # Usage over time
-            usage_df['date'] = pd.to_datetime(usage_df['date'])
-            
-            fig_usage = go.Figure()
-            
-            fig_usage.add_trace(go.Bar(
-                x=usage_df['date'],
-                y=usage_df['calls_made'],
-                name='API Calls',
-                marker_color='lightcoral'
-            ))
-            
-            fig_usage.add_trace(go.Bar(
-                x=usage_df['date'],
-                y=usage_df['houses_collected'],
-                name='Houses Collected',
-                marker_color='lightblue'
-            ))
-            
-            fig_usage.update_layout(
-                title="Daily API Usage vs Houses Collected",
-                xaxis_title="Date",
-                yaxis_title="Count",
-                barmode='group',
-                height=400
-            )
-            
-            st.plotly_chart(fig_usage, use_container_width=True)
-            
-            # Efficiency analysis
-            st.subheader("🎯 Collection Efficiency Analysis")
-            
-            if len(usage_df) > 1:
-                best_day = usage_df.loc[usage_df['efficiency_ratio'].idxmax()]
-                worst_day = usage_df.loc[usage_df['efficiency_ratio'].idxmin()]
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.success("**Best Performance**")
-                    st.write(f"Date: {best_day['date']}")
-                    st.write(f"Efficiency: {best_day['efficiency_ratio']:.1f} houses/call")
-                    st.write(f"Houses: {best_day['houses_collected']}")
-                
-                with col2:
-                    st.warning("**Needs Improvement**")
-                    st.write(f"Date: {worst_day['date']}")
-                    st.write(f"Efficiency: {worst_day['efficiency_ratio']:.1f} houses/call")
-                    st.write(f"Houses: {worst_day['houses_collected']}")
-        
-        else:
-            st.info("No API usage data available. Start collecting data to see analytics.")
+    else:
+        st.info("📈 No analytics data available. Start collecting data to see performance metrics.")
+
+@st.fragment
+def management_tab(collector, houses_df, activity_df, db_stats):
+    """Database information, manual operations and exports"""
+    st.header("⚙️ Management Tools")
     
-    with tab4:
-        st.header("⚙️ Data Management")
-        
-        # Database management
-        st.subheader("🗄️ Database Management")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            if st.button("🔍 Show Database Schema"):
-                schema_info = """
-                **Houses Table:**
-                - zpid (Primary Key)
-                - address, price, bedrooms, bathrooms
-                - sqft, lot_size, year_built
-                - latitude, longitude, neighborhood
-                - listing_url, photos, description
-                - data_source, last_updated, last_validated
-                - is_active (for tracking delisted properties)
+    # Database information
+    st.subheader("🗄️ Database Information")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.info("**Database Statistics**")
+        st.write(f"📊 Total houses: {db_stats.get('total_houses', 0)}")
+        st.write(f"✅ Active houses: {db_stats.get('active_houses', 0)}")
+        st.write(f"🆕 Recent houses (7 days): {db_stats.get('recent_houses', 0)}")
+        st.write(f"💰 Price range: ${db_stats.get('price_min', 0):,.0f} - ${db_stats.get('price_max', 0):,.0f}")
+    
+    with col2:
+        st.success("**Collection Status**")
+        st.write(f"📞 API calls today: {db_stats.get('today_calls', 0)}")
+        st.write(f"🏠 Houses today: {db_stats.get('today_houses', 0)}")
+        st.write(f"⚡ Today's efficiency: {db_stats.get('today_efficiency', 0):.1f} houses/call")
+        
+        # Database file info
+        try:
+            st.write(f"💾 Database size: {db_size_mb(collector.db_path):.1f} MB")
+        except:
+            st.write("💾 Database size: Unknown")
+    
+    # Manual operations
+    st.subheader("🔧 Manual Operations")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("🧹 Clean Database", help="Remove inactive listings older than 30 days"):
+            # Placeholder for cleanup operation
+            st.info("Database cleanup would remove old inactive listings")
+    
+    with col2:
+        if st.button("🔄 Refresh All Scores", help="Recalculate AI scores for all houses"):
+            st.info("This would recalculate all AI scores using current parameters")
+    
+    with col3:
+        if st.button("📊 Database Statistics", help="Show detailed database statistics"):
+            if len(houses_df) > 0:
+                avg_pps, avg_score, n_scored = _house_stats(
+                    houses_df['price'].to_numpy(dtype='float64', na_value=np.nan),
+                    houses_df['sqft'].to_numpy(dtype='float64', na_value=np.nan),
+                    houses_df['overall_score'].to_numpy(dtype='float64', na_value=np.nan)
+                )
                 
-                **API Usage Table:**
-                - date, calls_made, houses_collected
-                - efficiency_ratio
-                """
-                st.info(schema_info)
-        
-        with col2:
-            if st.button("🧹 Clean Database"):
-                # Remove duplicate entries
-                st.info("Database cleaning functionality would go here")
-        
-        # Strategic search configuration
-        st.subheader("🎯 Search Strategy Configuration")
-        
-        search_configs = collector.get_strategic_search_configs()
-        
-        st.write("**Current Search Configurations:**")
-        for i, config in enumerate(search_configs[:5]):
-            with st.expander(f"Search {i+1}: {config['location']} (Priority {config['priority']})"):
-                st.json(config)
-        
-        # Manual search option
-        st.subheader("🔧 Manual Search")
-        
-        with st.form("manual_search"):
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                location = st.text_input("Location", value="Minneapolis, MN")
-                max_price = st.number_input("Max Price", value=500000, step=10000)
-            
-            with col2:
-                min_beds = st.selectbox("Min Bedrooms", [1, 2, 3, 4, 5], index=1)
-                sort_by = st.selectbox("Sort By", ["priorityscore", "newest", "price_asc", "price_desc"])
-            
-            if st.form_submit_button("🔍 Execute Manual Search"):
-                if collector.api_calls_made < collector.max_calls_per_session:
-                    config = {
-                        "location": location,
-                        "max_price": max_price,
-                        "min_beds": min_beds,
-                        "sort": sort_by,
-                        "expected_count": 30,
-                        "priority": 1
-                    }
-                    
-                    with st.spinner("Executing search..."):
-                        houses = collector.execute_strategic_search(config)
-                        
-                        if houses:
-                            new_count = collector.store_houses_in_database(houses)
-                            st.success(f"Found {len(houses)} houses, {new_count} were new")
-                            
-                            # Show preview
-                            preview_df = pd.DataFrame(houses[:5])
-                            st.dataframe(preview_df[['address', 'price', 'bedrooms', 'sqft']])
-                        else:
-                            st.warning("No houses found with those criteria")
-                else:
-                    st.error("API call limit reached for this session")
+                st.write("**Detailed Statistics:**")
+                st.write(f"Houses with scores: {n_scored}")
+                st.write(f"Average score: {avg_score:.1%}")
+                st.write(f"Neighborhoods: {houses_df['neighborhood'].nunique()}")
+                st.write(f"Price per sqft avg: ${avg_pps:.0f}")
+    
+    # Export options
+    st.subheader("📁 Export Options")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("📥 Export All Active Houses"):
+            try:
+                csv_file = collector.export_comprehensive_data()
+                st.success(f"✅ Exported to: {csv_file}")
+            except Exception as e:
+                st.error(f"Export failed: {e}")
+    
+    with col2:
+        if st.button("📊 Export Collection Log"):
+            try:
+                st.download_button(
+                    "📥 Download Collection Log",
+                    csv_gz_bytes(activity_df),
+                    file_name=f"collection_log_{datetime.now().strftime('%Y%m%d')}.csv.gz",
+                    mime="application/gzip"
+                )
+            except Exception as e:
+                st.error(f"Export failed: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
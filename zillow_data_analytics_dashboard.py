@@ -4,15 +4,53 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
 import json
 import os
-import glob
 from datetime import datetime, timedelta
-import folium
-from streamlit_folium import st_folium
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; pandas' CSV parser is used instead
+    pa = None
+
+# Arrow types for the numeric columns, so every file parses to the same schema
+_ARROW_COLUMN_TYPES = {
+    'price': 'float64',
+    'sqft': 'float64',
+    'year_built': 'float64',
+    'latitude': 'float64',
+    'longitude': 'float64'
+}
+
+# Columns the dashboard reads; everything else in the CSVs is skipped at parse time
+WANTED_COLUMNS = frozenset([
+    'zpid', 'address', 'price', 'bedrooms', 'bathrooms', 'sqft', 'year_built',
+    'latitude', 'longitude', 'neighborhood', 'property_type'
+])
+
+# Narrow dtypes for the house frame (about half the memory of the defaults)
+HOUSE_DTYPES = {
+    'price': 'float32',
+    'sqft': 'float32',
+    'year_built': 'Int16',
+    'bedrooms': 'Int8',
+    'bathrooms': 'float32',
+    'latitude': 'float32',
+    'longitude': 'float32'
+}
+
+CATEGORY_COLUMNS = ('neighborhood', 'property_type', 'source_file')
+
+VIEW_LABELS = ("📡 API Metrics", "🏠 Classifications", "🗺️ Map View", "📈 Market Insights")
+
+# Point budgets for browser-rendered charts and maps
+SCATTER_MAX_POINTS = 5000
+MAP_CLUSTER_THRESHOLD = 2000
+
+# Marker colors for the lower, middle and upper third of the price range
+PRICE_COLORS = np.array(['green', 'orange', 'red'])
 
 st.set_page_config(
     page_title="Zillow Data Analytics",
@@ -41,31 +79,221 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def _narrow_dtypes(df):
+    """Cast the numeric columns present in df to HOUSE_DTYPES"""
+    return df.astype({col: dtype for col, dtype in HOUSE_DTYPES.items() if col in df.columns})
+
+def read_house_file(file, mtime):
+    """Read one house CSV, preferring a Parquet sidecar that is at least as new"""
+    if pa is None:
+        return pd.read_csv(file, usecols=lambda c: c in WANTED_COLUMNS, dtype=HOUSE_DTYPES)
+    
+    import pyarrow.parquet as pq
+    
+    sidecar = os.path.splitext(file)[0] + '.parquet'
+    if os.path.exists(sidecar) and os.path.getmtime(sidecar) >= mtime:
+        columns = [c for c in pq.read_schema(sidecar).names if c in WANTED_COLUMNS]
+        return _narrow_dtypes(pd.read_parquet(sidecar, engine='pyarrow', columns=columns))
+    
+    table = pa_csv.read_csv(
+        file,
+        read_options=pa_csv.ReadOptions(use_threads=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types={col: pa.type_for_alias(t) for col, t in _ARROW_COLUMN_TYPES.items()}
+        )
+    )
+    
+    # Mirror to Parquet so the next cold start skips CSV parsing entirely
+    try:
+        pq.write_table(table, sidecar, compression='zstd')
+    except (OSError, pa.ArrowException) as e:
+        print(f"⚠️ Parquet save skipped: {e}")
+        # A partial sidecar would be newer than the CSV and win the next read
+        if os.path.exists(sidecar):
+            os.remove(sidecar)
+    
+    table = table.select([c for c in table.column_names if c in WANTED_COLUMNS])
+    return _narrow_dtypes(table.to_pandas())
+
+def bucket_counts(values, bins, labels):
+    """Count values per [lo, hi) bin in one pass; out-of-range values are dropped"""
+    counts = pd.cut(values.to_numpy(dtype='float64', na_value=np.nan), bins=bins, labels=labels, right=False).value_counts()
+    return counts.reindex(labels, fill_value=0).to_dict()
+
+def category_counts(series):
+    """Value counts, most common first, from category codes when categorical"""
+    if not isinstance(series.dtype, pd.CategoricalDtype):
+        return series.value_counts().to_dict()
+    
+    codes = series.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(series.cat.categories))
+    order = np.argsort(-counts, kind='stable')
+    return {series.cat.categories[i]: int(counts[i]) for i in order if counts[i] > 0}
+
+def _normalize_zpid(zpid):
+    """Nullable Int64 zpids when every id is numeric, canonical strings otherwise"""
+    numeric = pd.to_numeric(zpid, errors='coerce')
+    is_numeric = numeric.notna()
+    if is_numeric.sum() == zpid.notna().sum():
+        return numeric.astype('Int64')
+    
+    # Numeric ids as their integer text, so 2, 2.0 and '2' are the same key
+    text = zpid.astype('string').str.strip()
+    text[is_numeric] = numeric[is_numeric].astype('Int64').astype('string')
+    return text
+
+@st.cache_data(show_spinner=False)
+def _load_all(files_sig):
+    """Load and combine all house data, parsed once per file signature"""
+    all_houses = []
+    file_sources = {}
+    
+    for file, mtime, size in files_sig:
+        try:
+            df = read_house_file(file, mtime)
+            
+            # Add source tracking
+            df['source_file'] = file
+            modified = datetime.fromtimestamp(mtime)
+            df['file_date'] = modified
+            
+            all_houses.append(df)
+            file_sources[file] = {
+                'houses': len(df),
+                'size_kb': size / 1024,
+                'modified': modified,
+                'modified_str': modified.strftime('%m/%d %H:%M')
+            }
+            
+        except Exception as e:
+            st.warning(f"Could not load {file}: {e}")
+    
+    if all_houses:
+        combined_df = pd.concat(all_houses, ignore_index=True, sort=False)
+        del all_houses
+        
+        # One key type for the combined column; per-file types would not compare equal
+        if 'zpid' in combined_df.columns:
+            combined_df['zpid'] = _normalize_zpid(combined_df['zpid'])
+        
+        # Remove duplicates based on address or zpid, keeping the newest file's row.
+        # Sorting and deduping through one take avoids materializing a sorted copy first.
+        order = np.argsort(combined_df['file_date'].to_numpy(), kind='stable')
+        if 'zpid' in combined_df.columns:
+            keys = combined_df['zpid'].iloc[order]
+        else:
+            keys = combined_df['address'].astype('category').iloc[order]
+        keep = ~keys.duplicated(keep='last').to_numpy()
+        combined_df = combined_df.take(order[keep]).reset_index(drop=True)
+        
+        # Categoricals only after concat, since per-file categories would not line up
+        for col in CATEGORY_COLUMNS:
+            if col in combined_df.columns:
+                combined_df[col] = combined_df[col].astype('category')
+        
+        return combined_df, file_sources
+    else:
+        return pd.DataFrame(), {}
+
+@st.cache_data(show_spinner=False)
+def _classify(files_sig, _df):
+    """Classify houses into categories, once per set of loaded files"""
+    
+    if len(_df) == 0:
+        return {}
+    
+    classifications = {}
+    
+    # Price categories
+    if 'price' in _df.columns:
+        classifications['Price Ranges'] = bucket_counts(
+            _df['price'],
+            [0, 250000, 400000, 600000, np.inf],
+            ['Budget-Friendly', 'Mid-Range', 'Premium', 'Luxury']
+        )
+    
+    # Size categories
+    if 'sqft' in _df.columns:
+        classifications['Size Categories'] = bucket_counts(
+            _df['sqft'],
+            [0, 1200, 1800, 2500, np.inf],
+            ['Cozy (<1200 sqft)', 'Medium (1200-1800 sqft)', 'Spacious (1800-2500 sqft)', 'Large (2500+ sqft)']
+        )
+    
+    # Age categories (newest first for display)
+    if 'year_built' in _df.columns:
+        current_year = datetime.now().year
+        age_counts = bucket_counts(
+            _df['year_built'],
+            [0, 1980, 2000, 2015, current_year + 1],
+            ['Vintage (<1980)', 'Established (1980-1999)', 'Modern (2000-2014)', 'New (2015+)']
+        )
+        classifications['Age Categories'] = dict(reversed(list(age_counts.items())))
+    
+    # Neighborhood distribution
+    if 'neighborhood' in _df.columns:
+        classifications['Neighborhoods'] = category_counts(_df['neighborhood'])
+    
+    # Property type
+    if 'property_type' in _df.columns:
+        classifications['Property Types'] = category_counts(_df['property_type'])
+    
+    return classifications
+
+@st.cache_data(show_spinner=False)
+def price_stats(files_sig, _df):
+    """Price summary and average $/sqft, computed once per set of loaded files"""
+    stats = {}
+    
+    if 'price' in _df.columns:
+        summary = _df['price'].describe()
+        stats['avg_price'] = summary['mean']
+        stats['median_price'] = summary['50%']
+        stats['min_price'] = summary['min']
+        stats['max_price'] = summary['max']
+    
+    if 'price' in _df.columns and 'sqft' in _df.columns:
+        price = _df['price'].to_numpy(dtype='float64', na_value=np.nan)
+        sqft = _df['sqft'].to_numpy(dtype='float64', na_value=np.nan)
+        
+        # Zero or missing sqft would give inf/NaN, so leave those rows out
+        price_per_sqft = price / np.where(sqft > 0, sqft, np.nan)
+        valid = ~np.isnan(price_per_sqft)
+        stats['avg_price_per_sqft'] = price_per_sqft[valid].mean() if valid.any() else None
+    
+    return stats
+
 class ZillowDataAnalyzer:
     """Analyze collected Zillow data"""
     
     def __init__(self):
+        self.file_stats = {}
         self.data_files = self.find_data_files()
         self.api_log = self.load_api_usage_log()
     
     def find_data_files(self):
-        """Find all Zillow data files"""
-        patterns = [
-            'real_scored_houses.csv',
-            'real_zillow_data.csv',
-            'zillow_houses_*.csv',
-            'comprehensive_houses_*.csv'
-        ]
-        
-        found_files = []
-        for pattern in patterns:
-            if '*' in pattern:
-                found_files.extend(glob.glob(pattern))
-            else:
-                if os.path.exists(pattern):
-                    found_files.append(pattern)
+        """Find all Zillow data files in one directory pass, recording their stats"""
+        literals = ('real_scored_houses.csv', 'real_zillow_data.csv')
+        prefixes = ('zillow_houses_', 'comprehensive_houses_')
+        
+        # Keep the literal files first and each prefix grouped, so later files win dedup
+        groups = {key: [] for key in literals + prefixes}
+        with os.scandir('.') as entries:
+            for entry in entries:
+                name = entry.name
+                if name in groups:
+                    key = name
+                elif name.startswith(prefixes) and name.endswith('.csv'):
+                    key = name.split('_houses_')[0] + '_houses_'
+                else:
+                    continue
+                
+                if entry.is_file():
+                    stat = entry.stat()
+                    self.file_stats[name] = (stat.st_mtime, stat.st_size)
+                    groups[key].append(name)
         
-        return found_files
+        return [name for key in groups for name in sorted(groups[key])]
     
     def load_api_usage_log(self):
         """Load or create API usage log"""
@@ -80,176 +308,56 @@ class ZillowDataAnalyzer:
         else:
             return {'calls': [], 'total_calls': 0, 'total_cost': 0}
     
+    def files_signature(self):
+        """(file, mtime, size) per found file; keys everything cached from the loaded data"""
+        return tuple((file, *self.file_stats[file]) for file in self.data_files)
+    
     def load_all_house_data(self):
         """Load and combine all house data"""
-        all_houses = []
-        file_sources = {}
-        
-        for file in self.data_files:
-            try:
-                df = pd.read_csv(file)
-                
-                # Add source tracking
-                df['source_file'] = file
-                df['file_date'] = datetime.fromtimestamp(os.path.getmtime(file))
-                
-                all_houses.append(df)
-                file_sources[file] = {
-                    'houses': len(df),
-                    'size_kb': os.path.getsize(file) / 1024,
-                    'modified': datetime.fromtimestamp(os.path.getmtime(file))
-                }
-                
-            except Exception as e:
-                st.warning(f"Could not load {file}: {e}")
-        
-        if all_houses:
-            combined_df = pd.concat(all_houses, ignore_index=True)
-            
-            # Remove duplicates based on address or zpid
-            if 'zpid' in combined_df.columns:
-                combined_df = combined_df.drop_duplicates(subset=['zpid'], keep='last')
-            else:
-                combined_df = combined_df.drop_duplicates(subset=['address'], keep='last')
-            
-            return combined_df, file_sources
-        else:
-            return pd.DataFrame(), {}
+        return _load_all(self.files_signature())
     
     def classify_houses(self, df):
-        """Classify houses into categories"""
-        
-        if len(df) == 0:
-            return {}
-        
-        classifications = {}
-        
-        # Price categories
-        if 'price' in df.columns:
-            price_ranges = {
-                'Budget-Friendly': (0, 250000),
-                'Mid-Range': (250000, 400000),
-                'Premium': (400000, 600000),
-                'Luxury': (600000, float('inf'))
-            }
-            
-            price_classification = {}
-            for category, (min_price, max_price) in price_ranges.items():
-                count = len(df[(df['price'] >= min_price) & (df['price'] < max_price)])
-                price_classification[category] = count
-            
-            classifications['Price Ranges'] = price_classification
-        
-        # Size categories
-        if 'sqft' in df.columns:
-            size_ranges = {
-                'Cozy (<1200 sqft)': (0, 1200),
-                'Medium (1200-1800 sqft)': (1200, 1800),
-                'Spacious (1800-2500 sqft)': (1800, 2500),
-                'Large (2500+ sqft)': (2500, float('inf'))
-            }
-            
-            size_classification = {}
-            for category, (min_size, max_size) in size_ranges.items():
-                count = len(df[(df['sqft'] >= min_size) & (df['sqft'] < max_size)])
-                size_classification[category] = count
-            
-            classifications['Size Categories'] = size_classification
-        
-        # Age categories
-        if 'year_built' in df.columns:
-            current_year = datetime.now().year
-            age_ranges = {
-                'New (2015+)': (2015, current_year + 1),
-                'Modern (2000-2014)': (2000, 2015),
-                'Established (1980-1999)': (1980, 2000),
-                'Vintage (<1980)': (0, 1980)
-            }
-            
-            age_classification = {}
-            for category, (min_year, max_year) in age_ranges.items():
-                count = len(df[(df['year_built'] >= min_year) & (df['year_built'] < max_year)])
-                age_classification[category] = count
-            
-            classifications['Age Categories'] = age_classification
-        
-        # Neighborhood distribution
-        if 'neighborhood' in df.columns:
-            neighborhood_counts = df['neighborhood'].value_counts().to_dict()
-            classifications['Neighborhoods'] = neighborhood_counts
-        
-        # Property type
-        if 'property_type' in df.columns:
-            property_counts = df['property_type'].value_counts().to_dict()
-            classifications['Property Types'] = property_counts
-        
-        return classifications
+        """Classify the houses returned by load_all_house_data into categories"""
+        return _classify(self.files_signature(), df)
     
-    def estimate_api_costs(self, df):
-        """Estimate API costs based on data collected"""
+    def estimate_api_costs(self, n_houses, n_neighborhoods):
+        """Estimate API costs from the house and neighborhood counts"""
         
         # RapidAPI Zillow pricing (approximate)
         cost_per_request = 0.01  # $0.01 per request (example)
         
-        # Estimate requests based on unique locations and searches
-        if 'neighborhood' in df.columns:
-            unique_locations = df['neighborhood'].nunique()
-        else:
-            unique_locations = 1
-        
         # Estimate requests: locations × search variations
-        estimated_requests = unique_locations * 3  # Assume 3 searches per location
+        estimated_requests = n_neighborhoods * 3  # Assume 3 searches per location
         estimated_cost = estimated_requests * cost_per_request
         
         return {
             'estimated_requests': estimated_requests,
             'estimated_cost': estimated_cost,
-            'cost_per_house': estimated_cost / len(df) if len(df) > 0 else 0
+            'cost_per_house': estimated_cost / n_houses if n_houses > 0 else 0
         }
 
-def display_api_metrics(analyzer):
+def metric_card(title, value):
+    """HTML for one gradient metric card"""
+    return f'<div class="metric-card"><h3>{title}</h3><h2>{value}</h2></div>'
+
+def display_api_metrics(analyzer, api_estimates, file_sources):
     """Display API usage metrics"""
     
     st.header("📡 API Usage Analytics")
     
     col1, col2, col3, col4 = st.columns(4)
     
-    # Load data to estimate metrics
-    df, file_sources = analyzer.load_all_house_data()
-    api_estimates = analyzer.estimate_api_costs(df)
-    
     with col1:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>Total API Calls</h3>
-            <h2>{}</h2>
-        </div>
-        """.format(api_estimates['estimated_requests']), unsafe_allow_html=True)
+        st.markdown(metric_card("Total API Calls", api_estimates['estimated_requests']), unsafe_allow_html=True)
     
     with col2:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>Estimated Cost</h3>
-            <h2>${:.2f}</h2>
-        </div>
-        """.format(api_estimates['estimated_cost']), unsafe_allow_html=True)
+        st.markdown(metric_card("Estimated Cost", f"${api_estimates['estimated_cost']:.2f}"), unsafe_allow_html=True)
     
     with col3:
-        st.markdown("""
-        <div class="metric-card">
-            <h3>Cost per House</h3>
-            <h2>${:.3f}</h2>
-        </div>
-        """.format(api_estimates['cost_per_house']), unsafe_allow_html=True)
+        st.markdown(metric_card("Cost per House", f"${api_estimates['cost_per_house']:.3f}"), unsafe_allow_html=True)
     
     with col4:
-        data_files_count = len(analyzer.data_files)
-        st.markdown("""
-        <div class="metric-card">
-            <h3>Data Files</h3>
-            <h2>{}</h2>
-        </div>
-        """.format(data_files_count), unsafe_allow_html=True)
+        st.markdown(metric_card("Data Files", len(analyzer.data_files)), unsafe_allow_html=True)
     
     # Data collection timeline
     if file_sources:
@@ -277,19 +385,15 @@ def display_api_metrics(analyzer):
         fig.update_layout(height=400)
         st.plotly_chart(fig, use_container_width=True)
 
-def display_house_classifications(analyzer):
+def display_house_classifications(df, classifications):
     """Display house classification analytics"""
     
     st.header("🏠 House Classifications")
     
-    df, _ = analyzer.load_all_house_data()
-    
     if len(df) == 0:
         st.warning("No house data found to analyze")
         return
     
-    classifications = analyzer.classify_houses(df)
-    
     # Create tabs for different classifications
     if classifications:
         tabs = st.tabs(list(classifications.keys()))
@@ -307,29 +411,71 @@ def display_house_classifications(analyzer):
                     fig.update_traces(textposition='inside', textinfo='percent+label')
                     st.plotly_chart(fig, use_container_width=True)
                     
-                    # Display as cards
+                    # Display as cards, one markdown call per column
                     cols = st.columns(min(3, len(data)))
-                    for j, (item, count) in enumerate(data.items()):
-                        col_idx = j % len(cols)
-                        with cols[col_idx]:
-                            percentage = (count / sum(values)) * 100
-                            st.markdown(f"""
-                            <div class="classification-card">
-                                <h4>{item}</h4>
-                                <h3>{count} houses</h3>
-                                <p>{percentage:.1f}% of total</p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                    total = sum(values)
+                    cards = [
+                        f'<div class="classification-card"><h4>{item}</h4>'
+                        f'<h3>{count} houses</h3><p>{count / total * 100:.1f}% of total</p></div>'
+                        for item, count in data.items()
+                    ]
+                    for col_idx, col in enumerate(cols):
+                        with col:
+                            st.markdown(''.join(cards[col_idx::len(cols)]), unsafe_allow_html=True)
                 else:
                     st.info(f"No data available for {category}")
 
-def display_geographic_map(analyzer):
+@st.cache_data(show_spinner=False)
+def summarize_neighborhoods(map_df):
+    """Per-neighborhood count and price/size aggregates, sorted by count"""
+    columns = ['Count', 'Avg Price', 'Min Price', 'Max Price', 'Avg SqFt']
+    
+    neighborhoods = map_df['neighborhood']
+    if isinstance(neighborhoods.dtype, pd.CategoricalDtype):
+        codes, labels = neighborhoods.cat.codes.to_numpy(), neighborhoods.cat.categories
+    else:
+        codes, labels = pd.factorize(neighborhoods)
+    
+    # Sort rows by group once, then reduce each contiguous run (NaN-aware like groupby)
+    keep = np.flatnonzero(codes >= 0)
+    order = keep[np.argsort(codes[keep], kind='stable')]
+    if len(order) == 0:
+        return pd.DataFrame(columns=columns, index=pd.Index([], name='neighborhood'))
+    
+    codes_s = codes[order]
+    price_s = map_df['price'].to_numpy(dtype='float64', na_value=np.nan)[order]
+    sqft_s = map_df['sqft'].to_numpy(dtype='float64', na_value=np.nan)[order]
+    edges = np.r_[0, np.flatnonzero(np.diff(codes_s)) + 1]
+    
+    price_ok = ~np.isnan(price_s)
+    sqft_ok = ~np.isnan(sqft_s)
+    count = np.add.reduceat(price_ok, edges)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        avg_price = np.add.reduceat(np.where(price_ok, price_s, 0), edges) / count
+        avg_sqft = np.add.reduceat(np.where(sqft_ok, sqft_s, 0), edges) / np.add.reduceat(sqft_ok, edges)
+    
+    neighborhood_summary = pd.DataFrame({
+        'Count': count,
+        'Avg Price': avg_price,
+        'Min Price': np.fmin.reduceat(price_s, edges),
+        'Max Price': np.fmax.reduceat(price_s, edges),
+        'Avg SqFt': avg_sqft
+    }, index=pd.Index(np.asarray(labels)[codes_s[edges]], name='neighborhood')).round(0)
+    
+    return neighborhood_summary.sort_values('Count', ascending=False)
+
+def _popup_value(value, spec=''):
+    """Format a map popup field, showing '?' for missing values"""
+    return '?' if pd.isna(value) else format(value, spec)
+
+def display_geographic_map(df):
     """Display houses on an interactive map"""
+    # Deferred so folium/branca only load when the map view is open
+    import folium
+    from streamlit_folium import st_folium
     
     st.header("🗺️ Geographic Distribution")
     
-    df, _ = analyzer.load_all_house_data()
-    
     if len(df) == 0 or 'latitude' not in df.columns or 'longitude' not in df.columns:
         st.warning("No geographic data available for mapping")
         return
@@ -349,62 +495,63 @@ def display_geographic_map(analyzer):
     
     m = folium.Map(location=[center_lat, center_lon], zoom_start=11)
     
-    # Color code by price if available
-    if 'price' in map_df.columns:
-        price_min = map_df['price'].min()
-        price_max = map_df['price'].max()
-        
-        def get_color(price):
-            # Color scale from green (cheap) to red (expensive)
+    # Add markers; large sets go to a client-side clusterer that only needs coordinates
+    lats = map_df['latitude'].to_numpy()
+    lons = map_df['longitude'].to_numpy()
+    if len(map_df) > MAP_CLUSTER_THRESHOLD:
+        from folium.plugins import FastMarkerCluster
+        FastMarkerCluster(np.column_stack([lats, lons]).tolist()).add_to(m)
+    else:
+        # Color code by price if available, green (cheap) to red (expensive)
+        if 'price' in map_df.columns:
+            price = map_df['price'].to_numpy(dtype='float64', na_value=np.nan)
+            price_min = np.nanmin(price)
+            price_max = np.nanmax(price)
+            
             normalized = (price - price_min) / (price_max - price_min)
-            if normalized < 0.33:
-                return 'green'
-            elif normalized < 0.67:
-                return 'orange'
-            else:
-                return 'red'
-    
-    # Add markers
-    for idx, house in map_df.iterrows():
-        # Create popup content
-        popup_content = f"""
-        <b>{house.get('address', 'Unknown Address')}</b><br>
-        💰 Price: ${house.get('price', 0):,}<br>
-        🏠 {house.get('bedrooms', '?')} bed, {house.get('bathrooms', '?')} bath<br>
-        📐 {house.get('sqft', '?')} sqft<br>
-        📅 Built: {house.get('year_built', '?')}<br>
-        🏘️ {house.get('neighborhood', '?')}
-        """
-        
-        if 'price' in house and pd.notna(house['price']):
-            color = get_color(house['price'])
+            colors = PRICE_COLORS[np.digitize(normalized, [0.33, 0.67])]
+            colors[np.isnan(price)] = 'blue'
         else:
-            color = 'blue'
-        
-        folium.CircleMarker(
-            location=[house['latitude'], house['longitude']],
-            radius=8,
-            popup=folium.Popup(popup_content, max_width=300),
-            color='white',
-            weight=2,
-            fillColor=color,
-            fillOpacity=0.7
-        ).add_to(m)
-    
-    # Add legend
-    if 'price' in map_df.columns:
-        legend_html = f'''
-        <div style="position: fixed; 
-                    bottom: 50px; left: 50px; width: 200px; height: 90px; 
-                    background-color: white; border:2px solid grey; z-index:9999; 
-                    font-size:14px; padding: 10px">
-        <p><b>Price Range</b></p>
-        <p><i class="fa fa-circle" style="color:green"></i> ${price_min:,.0f} - ${price_min + (price_max-price_min)/3:,.0f}</p>
-        <p><i class="fa fa-circle" style="color:orange"></i> ${price_min + (price_max-price_min)/3:,.0f} - ${price_min + 2*(price_max-price_min)/3:,.0f}</p>
-        <p><i class="fa fa-circle" style="color:red"></i> ${price_min + 2*(price_max-price_min)/3:,.0f} - ${price_max:,.0f}</p>
-        </div>
-        '''
-        m.get_root().html.add_child(folium.Element(legend_html))
+            colors = np.full(len(map_df), 'blue')
+        
+        # Collect markers in one layer and attach it to the map once
+        markers = folium.FeatureGroup(name='houses')
+        for house, color, lat, lon in zip(map_df.to_dict('records'), colors, lats, lons):
+            # Create popup content
+            popup_content = f"""
+            <b>{house.get('address', 'Unknown Address')}</b><br>
+            💰 Price: ${_popup_value(house.get('price'), ',.0f')}<br>
+            🏠 {_popup_value(house.get('bedrooms'))} bed, {_popup_value(house.get('bathrooms'))} bath<br>
+            📐 {_popup_value(house.get('sqft'), ',.0f')} sqft<br>
+            📅 Built: {_popup_value(house.get('year_built'))}<br>
+            🏘️ {_popup_value(house.get('neighborhood'))}
+            """
+            
+            folium.CircleMarker(
+                location=[lat, lon],
+                radius=8,
+                popup=folium.Popup(popup_content, max_width=300),
+                color='white',
+                weight=2,
+                fillColor=color,
+                fillOpacity=0.7
+            ).add_to(markers)
+        markers.add_to(m)
+        
+        # Add legend (clustered markers are uncolored, so only here)
+        if 'price' in map_df.columns:
+            legend_html = f'''
+            <div style="position: fixed; 
+                        bottom: 50px; left: 50px; width: 200px; height: 90px; 
+                        background-color: white; border:2px solid grey; z-index:9999; 
+                        font-size:14px; padding: 10px">
+            <p><b>Price Range</b></p>
+            <p><i class="fa fa-circle" style="color:green"></i> ${price_min:,.0f} - ${price_min + (price_max-price_min)/3:,.0f}</p>
+            <p><i class="fa fa-circle" style="color:orange"></i> ${price_min + (price_max-price_min)/3:,.0f} - ${price_min + 2*(price_max-price_min)/3:,.0f}</p>
+            <p><i class="fa fa-circle" style="color:red"></i> ${price_min + 2*(price_max-price_min)/3:,.0f} - ${price_max:,.0f}</p>
+            </div>
+            '''
+            m.get_root().html.add_child(folium.Element(legend_html))
     
     # Display map
     map_data = st_folium(m, width=1000, height=600)
@@ -413,23 +560,15 @@ def display_geographic_map(analyzer):
     if 'neighborhood' in map_df.columns:
         st.subheader("📍 Neighborhood Summary")
         
-        neighborhood_summary = map_df.groupby('neighborhood').agg({
-            'price': ['count', 'mean', 'min', 'max'],
-            'sqft': 'mean'
-        }).round(0)
-        
-        neighborhood_summary.columns = ['Count', 'Avg Price', 'Min Price', 'Max Price', 'Avg SqFt']
-        neighborhood_summary = neighborhood_summary.sort_values('Count', ascending=False)
+        neighborhood_summary = summarize_neighborhoods(map_df)
         
         st.dataframe(neighborhood_summary, use_container_width=True)
 
-def display_market_insights(analyzer):
+def display_market_insights(df, stats):
     """Display market insights and trends"""
     
     st.header("📈 Market Insights")
     
-    df, _ = analyzer.load_all_house_data()
-    
     if len(df) == 0:
         st.warning("No data available for market analysis")
         return
@@ -440,38 +579,50 @@ def display_market_insights(analyzer):
         # Price distribution
         if 'price' in df.columns:
             st.subheader("💰 Price Distribution")
-            fig = px.histogram(df, x='price', nbins=20, title="Distribution of House Prices")
+            # Bin prices here so the browser only receives the 20 bar heights
+            prices = df['price'].to_numpy(dtype='float64', na_value=np.nan)
+            counts, edges = np.histogram(prices[~np.isnan(prices)], bins=20)
+            fig = px.bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                title="Distribution of House Prices",
+                labels={'x': 'price', 'y': 'count'}
+            )
+            fig.update_traces(width=np.diff(edges))
             fig.update_layout(height=400)
             st.plotly_chart(fig, use_container_width=True)
             
             # Price statistics
             st.write("**Price Statistics:**")
-            st.write(f"• Average: ${df['price'].mean():,.0f}")
-            st.write(f"• Median: ${df['price'].median():,.0f}")
-            st.write(f"• Range: ${df['price'].min():,.0f} - ${df['price'].max():,.0f}")
+            st.write(f"• Average: ${stats['avg_price']:,.0f}")
+            st.write(f"• Median: ${stats['median_price']:,.0f}")
+            st.write(f"• Range: ${stats['min_price']:,.0f} - ${stats['max_price']:,.0f}")
     
     with col2:
         # Size vs Price correlation
         if 'sqft' in df.columns and 'price' in df.columns:
             st.subheader("📐 Size vs Price")
-            fig = px.scatter(df, x='sqft', y='price', 
+            # Only a fixed-size sample is shipped to the browser for large sets
+            plot_df = df.sample(SCATTER_MAX_POINTS, random_state=0) if len(df) > SCATTER_MAX_POINTS else df
+            fig = px.scatter(plot_df, x='sqft', y='price', 
                            hover_data=['address', 'neighborhood'] if 'neighborhood' in df.columns else ['address'],
-                           title="Square Footage vs Price")
+                           title="Square Footage vs Price",
+                           render_mode='webgl')
             fig.update_layout(height=400)
             st.plotly_chart(fig, use_container_width=True)
+            if plot_df is not df:
+                st.caption(f"Showing a random sample of {SCATTER_MAX_POINTS:,} of {len(df):,} houses")
             
             # Calculate price per sqft
-            if df['sqft'].sum() > 0:
-                avg_price_per_sqft = (df['price'] / df['sqft']).mean()
-                st.write(f"**Average Price per SqFt:** ${avg_price_per_sqft:.0f}")
+            if stats.get('avg_price_per_sqft') is not None:
+                st.write(f"**Average Price per SqFt:** ${stats['avg_price_per_sqft']:.0f}")
     
     # Market trends over time (if we have date data)
     if 'file_date' in df.columns:
         st.subheader("📅 Collection Trends")
         
         # Group by date and count houses
-        daily_counts = df.groupby(df['file_date'].dt.date).size().reset_index()
-        daily_counts.columns = ['Date', 'Houses Collected']
+        daily_counts = df.groupby(df['file_date'].dt.floor('D').rename('Date')).size().reset_index(name='Houses Collected')
         
         fig = px.line(daily_counts, x='Date', y='Houses Collected', 
                      title="Houses Collected Over Time")
@@ -480,23 +631,23 @@ def display_market_insights(analyzer):
     # Data quality metrics
     st.subheader("📊 Data Quality")
     
-    quality_metrics = []
-    
     key_fields = ['price', 'bedrooms', 'bathrooms', 'sqft', 'year_built', 'latitude', 'longitude']
-    
-    for field in key_fields:
-        if field in df.columns:
-            missing_count = df[field].isna().sum()
-            missing_percent = (missing_count / len(df)) * 100
-            quality_metrics.append({
-                'Field': field,
-                'Missing Count': missing_count,
-                'Missing %': f"{missing_percent:.1f}%",
-                'Data Quality': '✅ Good' if missing_percent < 10 else '⚠️ Fair' if missing_percent < 25 else '❌ Poor'
-            })
-    
-    if quality_metrics:
-        quality_df = pd.DataFrame(quality_metrics)
+    present = [field for field in key_fields if field in df.columns]
+    
+    if present:
+        # One isna reduction over all fields instead of a scan per field
+        missing = df[present].isna().sum()
+        missing_percent = missing.to_numpy() / len(df) * 100
+        quality_df = pd.DataFrame({
+            'Field': present,
+            'Missing Count': missing.to_numpy(),
+            'Missing %': [f"{pct:.1f}%" for pct in missing_percent],
+            'Data Quality': np.select(
+                [missing_percent < 10, missing_percent < 25],
+                ['✅ Good', '⚠️ Fair'],
+                '❌ Poor'
+            )
+        })
         st.dataframe(quality_df, use_container_width=True)
 
 def main():
@@ -525,8 +676,15 @@ def main():
         """)
         st.stop()
     
-    # Load data for overview
+    # Load data once; every tab renders from the same frame
     df, file_sources = analyzer.load_all_house_data()
+    files_sig = analyzer.files_signature()
+    classifications = analyzer.classify_houses(df)
+    stats = price_stats(files_sig, df)
+    
+    # Neighborhood count comes from the classifier rather than another column scan
+    n_neighborhoods = len(classifications['Neighborhoods']) if 'Neighborhoods' in classifications else 1
+    api_estimates = analyzer.estimate_api_costs(len(df), n_neighborhoods)
     
     # Sidebar with data overview
     with st.sidebar:
@@ -537,34 +695,30 @@ def main():
         if len(df) > 0:
             latest_file = max(file_sources.items(), key=lambda x: x[1]['modified'])
             st.write(f"**Latest:** {latest_file[0].split('/')[-1]}")
-            st.write(f"**Updated:** {latest_file[1]['modified'].strftime('%m/%d %H:%M')}")
+            st.write(f"**Updated:** {latest_file[1]['modified_str']}")
         
         st.markdown("---")
         
         # Data files list
         st.write("**Available Files:**")
         for file in analyzer.data_files:
-            file_size = os.path.getsize(file) / 1024
-            st.caption(f"📄 {file.split('/')[-1]} ({file_size:.1f}KB)")
+            st.caption(f"📄 {file.split('/')[-1]} ({analyzer.file_stats[file][1] / 1024:.1f}KB)")
         
         if st.button("🔄 Refresh Data"):
             st.cache_data.clear()
             st.rerun()
     
-    # Main dashboard tabs
-    tab1, tab2, tab3, tab4 = st.tabs(["📡 API Metrics", "🏠 Classifications", "🗺️ Map View", "📈 Market Insights"])
-    
-    with tab1:
-        display_api_metrics(analyzer)
-    
-    with tab2:
-        display_house_classifications(analyzer)
-    
-    with tab3:
-        display_geographic_map(analyzer)
-    
-    with tab4:
-        display_market_insights(analyzer)
+    # Main dashboard views; only the selected one runs on each rerun
+    view = st.radio("View", VIEW_LABELS, horizontal=True, key="active_view", label_visibility="collapsed")
+    
+    if view == VIEW_LABELS[0]:
+        display_api_metrics(analyzer, api_estimates, file_sources)
+    elif view == VIEW_LABELS[1]:
+        display_house_classifications(df, classifications)
+    elif view == VIEW_LABELS[2]:
+        display_geographic_map(df)
+    else:
+        display_market_insights(df, stats)
     
     # Footer with refresh timestamp
     st.markdown("---")